@@ -2,7 +2,15 @@
 
 __version__ = "0.1.0"
 
-from suno_mixer.pipeline.orchestrator import MixPipeline
 from suno_mixer.presets import GENRE_PRESETS, MOOD_WORDS
 
 __all__ = ["MixPipeline", "GENRE_PRESETS", "MOOD_WORDS", "__version__"]
+
+
+def __getattr__(name):
+    """Import MixPipeline on first access; it pulls in the audio stack."""
+    if name == "MixPipeline":
+        from suno_mixer.pipeline.orchestrator import MixPipeline
+
+        return MixPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
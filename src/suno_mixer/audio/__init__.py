@@ -2,6 +2,10 @@
 
 from suno_mixer.audio.downloader import download_tracks
 from suno_mixer.audio.mixer import AudioMixer
-from suno_mixer.audio.warmth import WarmthProcessor
+
+try:
+    from suno_mixer.audio.warmth import WarmthProcessor
+except ImportError:  # Pedalboard not installed, use the Numba kernel
+    from suno_mixer.audio.warmth_numba import NumbaWarmthProcessor as WarmthProcessor
 
 __all__ = ["AudioMixer", "download_tracks", "WarmthProcessor"]
@@ -10,6 +10,15 @@ import aiohttp
 
 logger = logging.getLogger(__name__)
 
+# Transient HTTP statuses worth retrying with backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# MP3s are already compressed, so skip transfer encoding
+DOWNLOAD_HEADERS = {"Accept-Encoding": "identity"}
+
+# Bodies up to this size are read whole and written in one call
+SMALL_BODY_BYTES = 32 * 1024 * 1024
+
 
 class DownloadError(Exception):
     """Download error."""
@@ -17,51 +26,138 @@ class DownloadError(Exception):
     pass
 
 
+def create_session(max_concurrent: int = 32) -> aiohttp.ClientSession:
+    """Create a session tuned for parallel downloads.
+
+    Concurrency is limited by the connector pool rather than a semaphore,
+    and DNS lookups are cached across requests.
+
+    Args:
+        max_concurrent: Maximum concurrent connections
+
+    Returns:
+        Configured aiohttp session
+    """
+    connector = aiohttp.TCPConnector(
+        limit=max_concurrent,
+        limit_per_host=max_concurrent,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+    timeout = aiohttp.ClientTimeout(total=None, sock_read=60)
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+
+async def _fetch(
+    session: aiohttp.ClientSession,
+    url: str,
+    output_path: Path,
+    chunk_size: int = 1 << 20,
+    retries: int = 3,
+) -> int:
+    """Download a single file and count the bytes written.
+
+    See download_file for arguments.
+
+    Returns:
+        Number of bytes written
+    """
+    delay = 1.0
+
+    try:
+        for attempt in range(retries + 1):
+            try:
+                async with session.get(url, headers=DOWNLOAD_HEADERS) as response:
+                    if response.status == 200:
+                        length = response.content_length
+                        if length is not None and length <= SMALL_BODY_BYTES:
+                            data = await response.read()
+                            async with aiofiles.open(output_path, "wb") as f:
+                                await f.write(data)
+
+                            logger.debug(f"Downloaded: {output_path.name}")
+                            return len(data)
+
+                        written = 0
+                        async with aiofiles.open(output_path, "wb") as f:
+                            buffer = bytearray()
+                            async for chunk in response.content.iter_any():
+                                buffer += chunk
+                                if len(buffer) >= chunk_size:
+                                    await f.write(buffer)
+                                    written += len(buffer)
+                                    buffer.clear()
+                            if buffer:
+                                await f.write(buffer)
+                                written += len(buffer)
+
+                        logger.debug(f"Downloaded: {output_path.name}")
+                        return written
+
+                    if response.status not in RETRY_STATUSES or attempt == retries:
+                        raise DownloadError(
+                            f"Failed to download {url}: HTTP {response.status}"
+                        )
+
+                    logger.warning(
+                        f"HTTP {response.status} downloading {output_path.name}, "
+                        f"retrying in {delay:.0f}s"
+                    )
+
+            except aiohttp.ClientError as e:
+                if attempt == retries:
+                    raise DownloadError(f"Network error downloading {url}: {e}")
+
+                logger.warning(
+                    f"Network error downloading {output_path.name}: {e}, "
+                    f"retrying in {delay:.0f}s"
+                )
+
+            await asyncio.sleep(delay)
+            delay *= 2
+
+        raise DownloadError(f"Failed to download {url}")
+    except BaseException:
+        # Never leave a truncated file behind that could pass for a track
+        output_path.unlink(missing_ok=True)
+        raise
+
+
 async def download_file(
     session: aiohttp.ClientSession,
     url: str,
     output_path: Path,
-    chunk_size: int = 8192,
+    chunk_size: int = 1 << 20,
+    retries: int = 3,
 ) -> Path:
     """Download a single file.
 
+    The parent directory of output_path must already exist; callers create
+    it once rather than once per file.
+
     Args:
         session: aiohttp session
         url: URL to download
-        output_path: Local path to save file
-        chunk_size: Download chunk size
+        output_path: Local path to save file (parent directory must exist)
+        chunk_size: Bytes buffered before each disk write (large bodies only)
+        retries: Retry attempts for rate-limit, server and network errors
 
     Returns:
         Path to downloaded file
 
     Raises:
-        DownloadError: If download fails
+        DownloadError: If download fails; no partial file is left behind
     """
-    try:
-        async with session.get(url) as response:
-            if response.status != 200:
-                raise DownloadError(
-                    f"Failed to download {url}: HTTP {response.status}"
-                )
-
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            async with aiofiles.open(output_path, "wb") as f:
-                async for chunk in response.content.iter_chunked(chunk_size):
-                    await f.write(chunk)
-
-            logger.debug(f"Downloaded: {output_path.name}")
-            return output_path
-
-    except aiohttp.ClientError as e:
-        raise DownloadError(f"Network error downloading {url}: {e}")
+    await _fetch(session, url, output_path, chunk_size=chunk_size, retries=retries)
+    return output_path
 
 
 async def download_tracks(
     urls: list[str],
     output_dir: Path,
     filenames: Optional[list[str]] = None,
-    max_concurrent: int = 5,
+    max_concurrent: int = 32,
+    session: Optional[aiohttp.ClientSession] = None,
 ) -> list[Path]:
     """Download multiple tracks in parallel.
 
@@ -69,7 +165,8 @@ async def download_tracks(
         urls: List of URLs to download
         output_dir: Directory to save files
         filenames: Optional list of filenames (must match urls length)
-        max_concurrent: Maximum concurrent downloads
+        max_concurrent: Maximum concurrent downloads (ignored if session is given)
+        session: Optional session to reuse; one is created and closed if omitted
 
     Returns:
         List of paths to downloaded files (same order as urls)
@@ -87,30 +184,28 @@ async def download_tracks(
     if not filenames:
         filenames = [f"track_{i + 1:02d}.mp3" for i in range(len(urls))]
 
-    logger.info(f"Downloading {len(urls)} tracks to {output_dir}")
+    paths = [output_dir / filename for filename in filenames]
 
-    semaphore = asyncio.Semaphore(max_concurrent)
+    logger.info(f"Downloading {len(urls)} tracks to {output_dir}")
 
-    async def limited_download(session, url, path):
-        async with semaphore:
-            return await download_file(session, url, path)
+    own_session = session is None
+    if own_session:
+        session = create_session(max_concurrent)
 
-    async with aiohttp.ClientSession() as session:
-        tasks = [
-            limited_download(session, url, output_dir / filename)
-            for url, filename in zip(urls, filenames)
-        ]
+    try:
+        tasks = [_fetch(session, url, path) for url, path in zip(urls, paths)]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
+    finally:
+        if own_session:
+            await session.close()
 
     # Check for errors
-    paths = []
     for i, result in enumerate(results):
         if isinstance(result, Exception):
             raise DownloadError(f"Failed to download track {i + 1}: {result}")
-        paths.append(result)
 
-    total_size = sum(p.stat().st_size for p in paths) / (1024 * 1024)
+    total_size = sum(results) / (1024 * 1024)
     logger.info(f"Downloaded {len(paths)} tracks ({total_size:.1f} MB)")
 
     return paths
@@ -0,0 +1,103 @@
+"""Shared DSP building blocks for warmth processing."""
+
+import functools
+import math
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+# Q of the low and high shelving filters
+SHELF_Q = 0.6
+
+# Fixed chorus and compressor settings
+CHORUS_CENTRE_DELAY_MS = 8.0
+COMPRESSOR_ATTACK_MS = 15
+COMPRESSOR_RELEASE_MS = 150
+
+
+def shelf_sos(gain_db: float, freq_hz: float, q: float, samplerate: int, high: bool) -> list[float]:
+    """RBJ cookbook shelving biquad as a normalized SOS row.
+
+    Args:
+        gain_db: Shelf gain in dB
+        freq_hz: Shelf corner frequency
+        q: Shelf Q
+        samplerate: Sample rate in Hz
+        high: True for a high shelf, False for a low shelf
+
+    Returns:
+        [b0, b1, b2, 1, a1, a2]
+    """
+    a = 10 ** (gain_db / 40)
+    w0 = 2 * math.pi * freq_hz / samplerate
+    cos_w0 = math.cos(w0)
+    alpha_term = 2 * math.sqrt(a) * math.sin(w0) / (2 * q)
+    sign = -1 if high else 1
+
+    b0 = a * ((a + 1) - sign * (a - 1) * cos_w0 + alpha_term)
+    b1 = sign * 2 * a * ((a - 1) - sign * (a + 1) * cos_w0)
+    b2 = a * ((a + 1) - sign * (a - 1) * cos_w0 - alpha_term)
+    a0 = (a + 1) + sign * (a - 1) * cos_w0 + alpha_term
+    a1 = -sign * 2 * ((a - 1) + sign * (a + 1) * cos_w0)
+    a2 = (a + 1) + sign * (a - 1) * cos_w0 - alpha_term
+
+    return [b0 / a0, b1 / a0, b2 / a0, 1.0, a1 / a0, a2 / a0]
+
+
+def lowpass_sos(freq_hz: float, samplerate: int) -> list[float]:
+    """First-order (6 dB/octave) lowpass as a normalized SOS row.
+
+    Args:
+        freq_hz: Cutoff frequency
+        samplerate: Sample rate in Hz
+
+    Returns:
+        [b0, b1, 0, 1, a1, 0]
+    """
+    k = math.tan(math.pi * freq_hz / samplerate)
+    return [k / (1 + k), k / (1 + k), 0.0, 1.0, (k - 1) / (k + 1), 0.0]
+
+
+class WarmthParams(BaseModel):
+    """Warmth effect parameters (see WarmthProcessor for descriptions)."""
+
+    model_config = ConfigDict(frozen=True)
+
+    low_shelf_gain_db: float = 2.5
+    low_shelf_freq_hz: float = 180.0
+    high_shelf_gain_db: float = -2.0
+    high_shelf_freq_hz: float = 7000.0
+    lowpass_freq_hz: float = 14000.0
+    chorus_rate_hz: float = 0.2
+    chorus_depth: float = 0.08
+    chorus_mix: float = 0.12
+    reverb_room_size: float = 0.25
+    reverb_damping: float = 0.8
+    reverb_wet: float = 0.08
+    compressor_threshold_db: float = -18.0
+    compressor_ratio: float = 2.0
+    makeup_gain_db: float = 1.0
+
+
+@functools.lru_cache(maxsize=8)
+def eq_sos(params: WarmthParams, samplerate: int) -> np.ndarray:
+    """Get the fused EQ cascade for a parameter set and sample rate.
+
+    The low shelf, high shelf and lowpass run as one second-order-sections
+    filter, so the EQ makes a single pass over each block.
+
+    Args:
+        params: Warmth parameters
+        samplerate: Sample rate in Hz
+
+    Returns:
+        (3, 6) float32 SOS coefficient array, shared between callers
+    """
+    return np.array([
+        # Warm low-end boost - BoC's rich bass
+        shelf_sos(params.low_shelf_gain_db, params.low_shelf_freq_hz, SHELF_Q, samplerate, high=False),
+        # Roll off harsh highs - tape-like darkness
+        shelf_sos(params.high_shelf_gain_db, params.high_shelf_freq_hz, SHELF_Q, samplerate, high=True),
+        # Gentle lowpass - removes digital edge
+        lowpass_sos(params.lowpass_freq_hz, samplerate),
+    ], dtype=np.float32)
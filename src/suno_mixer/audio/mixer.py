@@ -1,14 +1,39 @@
 """Audio mixing with crossfades and normalization."""
 
+import asyncio
+import hashlib
+import json
 import logging
+import math
+import os
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
 
+import numpy as np
 from pydub import AudioSegment
 
 from suno_mixer.config import MixerConfig
 
 logger = logging.getLogger(__name__)
 
+# Mix buffer format: 16-bit stereo at CD sample rate
+SAMPLE_RATE = 44100
+CHANNELS = 2
+SAMPLE_WIDTH = 2
+
+# numpy dtype for each pydub sample width in bytes
+SAMPLE_DTYPES = {1: np.int8, 2: np.int16, 4: np.int32}
+
+# ffprobe codec_name for each output format that can be stream-copied
+COPY_CODECS = {"mp3": "mp3"}
+
+# EBU R128 loudness range and true peak targets (integrated target comes from config)
+LOUDNORM_LRA = 11
+LOUDNORM_TP = -1.0
+
 
 class MixerError(Exception):
     """Audio mixer error."""
@@ -29,6 +54,13 @@ class AudioMixer:
         self.transition_type = config.transition_type
         self.crossfade_ms = config.crossfade_duration_ms
         self.target_dbfs = config.target_loudness_dbfs
+        self.normalization = config.normalization
+        self._loudness_cache: dict[str, dict] = {}
+
+    @property
+    def _loudnorm_filter(self) -> str:
+        """Base loudnorm filter targeting the configured loudness."""
+        return f"loudnorm=I={self.target_dbfs}:LRA={LOUDNORM_LRA}:TP={LOUDNORM_TP}"
 
     def load_track(self, path: Path) -> AudioSegment:
         """Load an audio track.
@@ -57,14 +89,634 @@ class AudioMixer:
         Returns:
             Normalized audio
         """
-        change_in_dbfs = self.target_dbfs - audio.dBFS
+        change_in_dbfs = self.target_dbfs - self._fast_dbfs(audio)
         return audio.apply_gain(change_in_dbfs)
 
+    @staticmethod
+    def _fast_dbfs(audio: AudioSegment) -> float:
+        """Compute RMS level in dBFS with numpy.
+
+        Equivalent to AudioSegment.dBFS, but reads the raw buffer directly
+        instead of going through audioop (a pure-Python fallback on 3.13+).
+
+        Args:
+            audio: Audio to measure
+
+        Returns:
+            RMS level in dBFS (-inf for silence)
+        """
+        dtype = SAMPLE_DTYPES[audio.sample_width]
+        samples = np.frombuffer(audio.raw_data, dtype=dtype).astype(np.float64)
+        if not samples.size:
+            return -float("inf")
+
+        rms = math.sqrt(np.dot(samples, samples) / samples.size)
+        if not rms:
+            return -float("inf")
+        return 20 * math.log10(rms / audio.max_possible_amplitude)
+
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        """Hash file contents for the loudness cache key."""
+        with open(path, "rb") as f:
+            return hashlib.file_digest(f, "sha1").hexdigest()
+
+    def _analysis_cmd(self, path: Path) -> list[str]:
+        """Build the ffmpeg loudnorm analysis (first pass) command."""
+        return [
+            "ffmpeg", "-hide_banner", "-nostats",
+            "-i", str(path),
+            "-af", f"{self._loudnorm_filter}:print_format=json",
+            "-f", "null", "-",
+        ]
+
+    def _measured_loudnorm_filter(self, measured: dict) -> str:
+        """Build the loudnorm (second pass) filter from a measurement."""
+        return (
+            f"{self._loudnorm_filter}"
+            f":measured_I={measured['input_i']}"
+            f":measured_LRA={measured['input_lra']}"
+            f":measured_TP={measured['input_tp']}"
+            f":measured_thresh={measured['input_thresh']}"
+            f":offset={measured['target_offset']}"
+            ":linear=true"
+        )
+
+    def _normalize_cmd(self, path: Path, measured: dict) -> list[str]:
+        """Build the ffmpeg loudnorm (second pass) decode command."""
+        return [
+            "ffmpeg", "-hide_banner",
+            "-i", str(path),
+            "-af", self._measured_loudnorm_filter(measured),
+            "-f", "s16le",
+            "-ac", str(CHANNELS),
+            "-ar", str(SAMPLE_RATE),
+            "-",
+        ]
+
+    @staticmethod
+    def _parse_loudness(path: Path, stderr: str) -> dict:
+        """Parse the loudnorm JSON summary from ffmpeg stderr.
+
+        Raises:
+            MixerError: If the summary is missing or malformed
+        """
+        try:
+            # loudnorm prints its JSON summary at the end of stderr
+            return json.loads(stderr[stderr.rindex("{") : stderr.rindex("}") + 1])
+        except ValueError as e:
+            raise MixerError(f"Could not parse loudness measurement for {path}: {e}")
+
+    def _measure_loudness(self, path: Path) -> dict:
+        """Measure track loudness with an ffmpeg loudnorm analysis pass.
+
+        Measurements are cached by file content hash, so mixing the same
+        track again skips the analysis pass.
+
+        Args:
+            path: Path to audio file
+
+        Returns:
+            loudnorm measurement dict (input_i, input_lra, input_tp, ...)
+
+        Raises:
+            MixerError: If measurement fails
+        """
+        digest = self._file_digest(path)
+
+        if digest in self._loudness_cache:
+            return self._loudness_cache[digest]
+
+        try:
+            result = subprocess.run(
+                self._analysis_cmd(path), capture_output=True, text=True, check=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise MixerError(f"Loudness measurement failed for {path}: {e.stderr}")
+
+        measured = self._parse_loudness(path, result.stderr)
+        self._loudness_cache[digest] = measured
+        return measured
+
+    def loudnorm(self, path: Path) -> np.ndarray:
+        """Decode a track with two-pass EBU R128 loudness normalization.
+
+        Args:
+            path: Path to audio file
+
+        Returns:
+            int16 (frames, channels) sample array
+
+        Raises:
+            MixerError: If normalization fails
+        """
+        measured = self._measure_loudness(path)
+        logger.debug(f"Loudness {path.name}: {measured['input_i']} LUFS")
+
+        try:
+            result = subprocess.run(
+                self._normalize_cmd(path, measured), capture_output=True, check=True
+            )
+        except subprocess.CalledProcessError as e:
+            raise MixerError(f"Loudness normalization failed for {path}: {e.stderr.decode()}")
+
+        return np.frombuffer(result.stdout, dtype=np.int16).reshape(-1, CHANNELS)
+
+    @staticmethod
+    async def _run_ffmpeg(cmd: list[str]) -> tuple[bytes, bytes]:
+        """Run ffmpeg as an asyncio subprocess.
+
+        Args:
+            cmd: ffmpeg command line
+
+        Returns:
+            (stdout, stderr) bytes
+
+        Raises:
+            MixerError: If ffmpeg exits with an error
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise MixerError(f"FFmpeg failed: {stderr.decode(errors='replace')}")
+        return stdout, stderr
+
+    @property
+    def decodes_tracks(self) -> bool:
+        """Whether mixing decodes each track to a normalized array up front.
+
+        True for clean-cut loudnorm mixes, whose tracks can be prepared with
+        loudnorm_async as soon as each one is available.
+        """
+        return self.normalization == "loudnorm" and self.transition_type != "crossfade"
+
+    async def _measure_loudness_async(self, path: Path) -> dict:
+        """Async variant of _measure_loudness sharing its cache.
+
+        Args:
+            path: Path to audio file
+
+        Returns:
+            loudnorm measurement dict (input_i, input_lra, input_tp, ...)
+
+        Raises:
+            MixerError: If measurement fails
+        """
+        digest = await asyncio.to_thread(self._file_digest, path)
+
+        measured = self._loudness_cache.get(digest)
+        if measured is None:
+            _, stderr = await self._run_ffmpeg(self._analysis_cmd(path))
+            measured = self._parse_loudness(path, stderr.decode(errors="replace"))
+            self._loudness_cache[digest] = measured
+        return measured
+
+    async def loudnorm_async(self, path: Path) -> np.ndarray:
+        """Async variant of loudnorm running both passes as subprocesses.
+
+        Args:
+            path: Path to audio file
+
+        Returns:
+            int16 (frames, channels) sample array
+
+        Raises:
+            MixerError: If normalization fails
+        """
+        measured = await self._measure_loudness_async(path)
+        logger.debug(f"Loudness {path.name}: {measured['input_i']} LUFS")
+
+        stdout, _ = await self._run_ffmpeg(self._normalize_cmd(path, measured))
+        return np.frombuffer(stdout, dtype=np.int16).reshape(-1, CHANNELS)
+
+    async def loudnorm_many(self, track_paths: list[Path]) -> list[np.ndarray]:
+        """Loudness-normalize tracks with concurrent ffmpeg processes.
+
+        Concurrency is capped at the CPU count, since each ffmpeg process
+        keeps roughly one core busy.
+
+        Args:
+            track_paths: List of paths to audio files
+
+        Returns:
+            int16 (frames, channels) sample arrays (same order as track_paths)
+
+        Raises:
+            MixerError: If normalization fails for any track
+        """
+        semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+        async def run(path: Path) -> np.ndarray:
+            async with semaphore:
+                return await self.loudnorm_async(Path(path))
+
+        return list(await asyncio.gather(*(run(path) for path in track_paths)))
+
+    def _to_array(self, audio: AudioSegment) -> np.ndarray:
+        """Convert audio to an int16 (frames, channels) sample array.
+
+        Args:
+            audio: Audio to convert
+
+        Returns:
+            Sample array at the mix buffer format
+        """
+        audio = (
+            audio.set_frame_rate(SAMPLE_RATE)
+            .set_channels(CHANNELS)
+            .set_sample_width(SAMPLE_WIDTH)
+        )
+        samples = np.frombuffer(audio.get_array_of_samples(), dtype=np.int16)
+        return samples.reshape(-1, CHANNELS)
+
+    def _decode_tracks(self, track_paths: list[Path], normalize: bool) -> list[np.ndarray]:
+        """Decode and optionally normalize each track into a sample array.
+
+        Args:
+            track_paths: List of paths to audio files
+            normalize: Whether to normalize each track
+
+        Returns:
+            int16 (frames, channels) sample arrays
+        """
+        use_loudnorm = normalize and self.normalization == "loudnorm"
+        read = self.loudnorm if use_loudnorm else self.load_track
+
+        # Double buffer: the ffmpeg decode of the next track runs in a worker
+        # thread while this thread normalizes and converts the current one
+        tracks = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(read, Path(track_paths[0]))
+            for i in range(len(track_paths)):
+                decoded = pending.result()
+                if i + 1 < len(track_paths):
+                    pending = executor.submit(read, Path(track_paths[i + 1]))
+
+                if use_loudnorm:
+                    tracks.append(decoded)
+                    continue
+
+                if normalize:
+                    decoded = self.normalize(decoded)
+                tracks.append(self._to_array(decoded))
+        return tracks
+
+    def _mix_numpy(
+        self,
+        track_paths: list[Path],
+        normalize: bool = True,
+        tracks: Optional[list[np.ndarray]] = None,
+    ) -> np.ndarray:
+        """Join tracks with clean cuts into a single preallocated sample buffer.
+
+        Each track is copied into the buffer exactly once, so mixing cost
+        grows linearly with the number of tracks rather than re-copying the
+        accumulated mix on every append. Crossfades are mixed by ffmpeg in
+        _mix_ffmpeg.
+
+        Args:
+            track_paths: List of paths to audio files
+            normalize: Whether to normalize each track
+            tracks: Already decoded sample arrays; skips decoding when given.
+                The list is taken over: each entry is cleared once copied so
+                the track can be freed while the rest are mixed
+
+        Returns:
+            int16 (frames, channels) sample array
+        """
+        if tracks is None:
+            tracks = self._decode_tracks(track_paths, normalize)
+
+        mixed = np.empty((sum(len(track) for track in tracks), CHANNELS), dtype=np.int16)
+
+        offset = 0
+        for i, track in enumerate(tracks):
+            mixed[offset : offset + len(track)] = track
+            offset += len(track)
+            tracks[i] = None  # Release decoded track once copied
+            logger.debug(f"Added track {i + 1}/{len(track_paths)}")
+
+        return mixed
+
+    def _mix_ffmpeg(
+        self,
+        track_paths: list[Path],
+        output_path: Path,
+        normalize: bool = True,
+        companion: Optional[tuple[Path, list[str]]] = None,
+        output_format: Optional[str] = None,
+    ) -> None:
+        """Crossfade tracks in a single streaming ffmpeg filter graph.
+
+        Chains an acrossfade between each pair of inputs, so decode, mixing
+        and encode all happen inside ffmpeg without holding the mix in
+        memory. Each input is normalized before the crossfades exactly as
+        _mix_numpy normalizes its tracks: a two-pass loudnorm for
+        "loudnorm", or an RMS gain to the target dBFS for "dbfs".
+
+        Args:
+            track_paths: List of paths to audio files
+            output_path: Path for output file
+            normalize: Whether to normalize each track
+            companion: Optional (path, ffmpeg output args) for a second
+                encode of the mix from the same decode, e.g. a video's audio track
+            output_format: Output format, defaults to the configured one
+
+        Raises:
+            MixerError: If ffmpeg fails
+        """
+        crossfade_seconds = self.crossfade_ms / 1000
+
+        cmd = ["ffmpeg", "-y", "-hide_banner"]
+        for path in track_paths:
+            cmd.extend(["-i", str(path)])
+
+        filters = []
+        inputs = []
+        for i, path in enumerate(track_paths):
+            input_filter = self._input_normalize_filter(Path(path)) if normalize else None
+            if input_filter:
+                filters.append(f"[{i}:a]{input_filter}[n{i}]")
+                inputs.append(f"[n{i}]")
+            else:
+                inputs.append(f"[{i}:a]")
+
+        label = inputs[0]
+        for i in range(1, len(track_paths)):
+            next_label = f"[x{i}]"
+            filters.append(
+                f"{label}{inputs[i]}acrossfade=d={crossfade_seconds}:c1=tri:c2=tri{next_label}"
+            )
+            label = next_label
+
+        final = "anull"
+        if companion:
+            final += ",asplit=2[out][companion]"
+        else:
+            final += "[out]"
+        filters.append(f"{label}{final}")
+
+        cmd.extend([
+            "-filter_complex", ";".join(filters),
+            "-map", "[out]",
+            "-ar", str(SAMPLE_RATE),
+        ])
+
+        if (output_format or self.config.output_format) == "mp3":
+            cmd.extend(["-c:a", "libmp3lame", "-b:a", self.config.output_bitrate])
+
+        cmd.append(str(output_path))
+
+        if companion:
+            companion_path, companion_args = companion
+            cmd.extend([
+                "-map", "[companion]", "-ar", str(SAMPLE_RATE),
+                *companion_args, str(companion_path),
+            ])
+
+        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+
+        try:
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise MixerError(f"FFmpeg mix failed: {e.stderr}")
+
+    def _input_normalize_filter(self, path: Path) -> str:
+        """Build the per-input normalization filter for a crossfade mix.
+
+        Args:
+            path: Path to audio file
+
+        Returns:
+            ffmpeg filter chain, empty if the track needs no gain change
+
+        Raises:
+            MixerError: If the track cannot be measured
+        """
+        if self.normalization == "loudnorm":
+            measured = self._measure_loudness(path)
+            logger.debug(f"Loudness {path.name}: {measured['input_i']} LUFS")
+            # loudnorm runs at 192kHz internally, so resample back for the crossfades
+            return f"{self._measured_loudnorm_filter(measured)},aresample={SAMPLE_RATE}"
+
+        level = self._fast_dbfs(self.load_track(path))
+        if not math.isfinite(level):
+            return ""
+        return f"volume={self.target_dbfs - level:.4f}dB"
+
+    def _probe_stream(self, path: Path) -> tuple[str, str, int] | None:
+        """Read codec, sample rate and channel count of the first audio stream.
+
+        Args:
+            path: Path to audio file
+
+        Returns:
+            (codec_name, sample_rate, channels), or None if probing fails
+        """
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-select_streams", "a:0",
+            "-show_streams",
+            "-of", "json",
+            str(path),
+        ]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            stream = json.loads(result.stdout)["streams"][0]
+            return stream["codec_name"], stream["sample_rate"], stream["channels"]
+        except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError, IndexError):
+            return None
+
+    def _can_stream_copy(self, track_paths: list[Path], output_format: str) -> bool:
+        """Check whether tracks can be concatenated without re-encoding.
+
+        All inputs must share one stream layout whose codec matches the
+        output format.
+
+        Args:
+            track_paths: List of paths to audio files
+            output_format: Output format of the mix
+
+        Returns:
+            True if the concat demuxer can copy the streams as-is
+        """
+        codec = COPY_CODECS.get(output_format)
+        if codec is None:
+            return False
+
+        streams = {self._probe_stream(path) for path in track_paths}
+        if len(streams) != 1:
+            return False
+
+        stream = streams.pop()
+        return stream is not None and stream[0] == codec
+
+    def _concat_copy(
+        self,
+        track_paths: list[Path],
+        output_path: Path,
+        companion: Optional[tuple[Path, list[str]]] = None,
+    ) -> None:
+        """Join tracks with the ffmpeg concat demuxer using stream copy.
+
+        Args:
+            track_paths: List of paths to audio files
+            output_path: Path for output file
+            companion: Optional (path, ffmpeg output args) for a second
+                encode of the mix from the same decode, e.g. a video's audio track
+
+        Raises:
+            MixerError: If ffmpeg fails
+        """
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".txt", dir=output_path.parent, delete=False
+        ) as f:
+            for path in track_paths:
+                escaped = str(Path(path).resolve()).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+            list_path = Path(f.name)
+
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner",
+            "-f", "concat", "-safe", "0",
+            "-i", str(list_path),
+            "-map", "0:a",
+            "-c", "copy",
+            str(output_path),
+        ]
+
+        if companion:
+            companion_path, companion_args = companion
+            cmd.extend(["-map", "0:a", *companion_args, str(companion_path)])
+
+        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+
+        try:
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise MixerError(f"FFmpeg concat failed: {e.stderr}")
+        finally:
+            list_path.unlink(missing_ok=True)
+
+    def _encode(
+        self,
+        samples: np.ndarray,
+        output_path: Path,
+        companion: Optional[tuple[Path, list[str]]] = None,
+        output_format: Optional[str] = None,
+    ) -> None:
+        """Encode a mix buffer by piping raw samples into ffmpeg.
+
+        Avoids the temporary WAV that AudioSegment.export writes first.
+
+        Args:
+            samples: (frames, channels) int16 mix buffer
+            output_path: Path for output file
+            companion: Optional (path, ffmpeg output args) for a second
+                encode of the mix from the same decode, e.g. a video's audio track
+            output_format: Output format, defaults to the configured one
+
+        Raises:
+            MixerError: If ffmpeg fails
+        """
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-v", "error",
+            "-f", "s16le", "-ar", str(SAMPLE_RATE), "-ac", str(CHANNELS),
+            "-i", "-",
+            *self._output_args(output_path, companion, output_format),
+        ]
+
+        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE)
+        try:
+            proc.stdin.write(memoryview(np.ascontiguousarray(samples)).cast("B"))
+        except BrokenPipeError:
+            pass  # ffmpeg exited early; its stderr explains why
+        finally:
+            proc.stdin.close()
+        stderr = proc.stderr.read()
+        if proc.wait() != 0:
+            raise MixerError(f"FFmpeg encode failed: {stderr.decode(errors='replace')}")
+
+    def _output_args(
+        self,
+        output_path: Path,
+        companion: Optional[tuple[Path, list[str]]] = None,
+        output_format: Optional[str] = None,
+    ) -> list[str]:
+        """Build ffmpeg output args for a mix and its optional companion.
+
+        Args:
+            output_path: Path for output file
+            companion: Optional (path, ffmpeg output args) for a second encode
+            output_format: Output format, defaults to the configured one
+
+        Returns:
+            ffmpeg output args
+        """
+        export_format = output_format or self.config.output_format
+
+        args = []
+        if export_format == "mp3":
+            args.extend(["-c:a", "libmp3lame", "-b:a", self.config.output_bitrate])
+        args.extend(["-f", export_format, str(output_path)])
+
+        if companion:
+            companion_path, companion_args = companion
+            args.extend([*companion_args, str(companion_path)])
+        return args
+
+    def export(
+        self,
+        input_path: Path,
+        output_path: Path,
+        companion: Optional[tuple[Path, list[str]]] = None,
+    ) -> Path:
+        """Encode a lossless intermediate mix to the configured output format.
+
+        Args:
+            input_path: Path to the intermediate audio file, e.g. a WAV mix
+            output_path: Path for output file
+            companion: Optional (path, ffmpeg output args) for a second
+                encode from the same decode, e.g. a video's audio track
+
+        Returns:
+            Path to the encoded mix
+
+        Raises:
+            MixerError: If ffmpeg fails
+        """
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        cmd = [
+            "ffmpeg", "-y", "-hide_banner", "-v", "error",
+            "-i", str(input_path),
+            *self._output_args(output_path, companion),
+        ]
+
+        logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+
+        try:
+            subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except subprocess.CalledProcessError as e:
+            raise MixerError(f"FFmpeg export failed: {e.stderr}")
+
+        logger.info(f"Exported mix: {output_path}")
+        return output_path
+
     def create_mix(
         self,
         track_paths: list[Path],
         output_path: Path,
         normalize: bool = True,
+        tracks: Optional[list[np.ndarray]] = None,
+        companion: Optional[tuple[Path, list[str]]] = None,
+        output_format: Optional[str] = None,
     ) -> Path:
         """Mix multiple tracks with crossfades.
 
@@ -72,6 +724,13 @@ class AudioMixer:
             track_paths: List of paths to audio files
             output_path: Path for output file
             normalize: Whether to normalize each track
+            tracks: Already decoded (and normalized) sample arrays for
+                clean-cut mixes, e.g. from loudnorm_many. The list is taken
+                over and its entries are cleared as they are mixed
+            companion: Optional (path, ffmpeg output args) for a second
+                encode of the mix from the same decode, e.g. a video's audio track
+            output_format: Output format, defaults to the configured one;
+                "wav" gives a lossless mix for further processing
 
         Returns:
             Path to mixed audio file
@@ -82,62 +741,124 @@ class AudioMixer:
         if not track_paths:
             raise MixerError("No tracks provided")
 
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
         if self.transition_type == "crossfade":
             logger.info(f"Mixing {len(track_paths)} tracks with {self.crossfade_ms}ms crossfade")
-        else:
-            logger.info(f"Mixing {len(track_paths)} tracks with clean cuts")
-
-        # Load first track
-        mixed = self.load_track(track_paths[0])
-        if normalize:
-            mixed = self.normalize(mixed)
-
-        # Append remaining tracks
-        for i, path in enumerate(track_paths[1:], start=2):
-            track = self.load_track(path)
-            if normalize:
-                track = self.normalize(track)
-
-            # Apply transition based on type
-            if self.transition_type == "crossfade":
-                mixed = mixed.append(track, crossfade=self.crossfade_ms)
-            else:
-                # Clean cut - simple concatenation
-                mixed = mixed + track
-            logger.debug(f"Added track {i}/{len(track_paths)}")
+            self._mix_ffmpeg(
+                track_paths,
+                output_path,
+                normalize=normalize,
+                companion=companion,
+                output_format=output_format,
+            )
+            logger.info(f"Mix complete: {output_path}")
+            return output_path
+
+        logger.info(f"Mixing {len(track_paths)} tracks with clean cuts")
+
+        # Normalization changes samples, so only unnormalized cuts can skip re-encoding
+        if (
+            tracks is None
+            and not normalize
+            and self._can_stream_copy(track_paths, output_format or self.config.output_format)
+        ):
+            logger.info("Inputs match output codec, concatenating without re-encoding")
+            self._concat_copy(track_paths, output_path, companion=companion)
+            logger.info(f"Mix complete: {output_path}")
+            return output_path
+
+        samples = self._mix_numpy(track_paths, normalize=normalize, tracks=tracks)
 
         # Get duration
-        duration_seconds = len(mixed) / 1000
+        duration_seconds = len(samples) / SAMPLE_RATE
         duration_str = self._format_duration(duration_seconds)
 
         logger.info(f"Mix complete: {duration_str}")
 
-        # Export
-        output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        logger.info(f"Exporting to {output_path}")
+        self._encode(samples, output_path, companion=companion, output_format=output_format)
 
-        export_format = self.config.output_format
-        export_params = {}
+        return output_path
 
-        if export_format == "mp3":
-            export_params["bitrate"] = self.config.output_bitrate
+    async def create_mix_async(
+        self,
+        track_paths: list[Path],
+        output_path: Path,
+        normalize: bool = True,
+        tracks: Optional[list[np.ndarray]] = None,
+        companion: Optional[tuple[Path, list[str]]] = None,
+        output_format: Optional[str] = None,
+    ) -> Path:
+        """Mix tracks without blocking the event loop.
 
-        logger.info(f"Exporting to {output_path}")
-        mixed.export(str(output_path), format=export_format, **export_params)
+        Clean-cut loudnorm mixes run their per-track passes as concurrent
+        ffmpeg processes, and crossfade loudnorm mixes measure their tracks
+        concurrently; the mix itself runs create_mix in a thread.
 
-        return output_path
+        Args:
+            track_paths: List of paths to audio files
+            output_path: Path for output file
+            normalize: Whether to normalize each track
+            tracks: Sample arrays already prepared with loudnorm_async; the
+                list is taken over and its entries are cleared as they are mixed
+            companion: Optional (path, ffmpeg output args) for a second
+                encode of the mix from the same decode, e.g. a video's audio track
+            output_format: Output format, defaults to the configured one
+
+        Returns:
+            Path to mixed audio file
+
+        Raises:
+            MixerError: If mixing fails
+        """
+        if tracks is None and track_paths and normalize and self.decodes_tracks:
+            tracks = await self.loudnorm_many(track_paths)
+        elif normalize and self.transition_type == "crossfade" and self.normalization == "loudnorm":
+            # Crossfade mixes normalize inside ffmpeg; measure every track
+            # concurrently first so the mix finds the measurements cached
+            semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+            async def measure(path: Path) -> None:
+                async with semaphore:
+                    await self._measure_loudness_async(Path(path))
+
+            await asyncio.gather(*(measure(path) for path in track_paths))
+
+        return await asyncio.to_thread(
+            self.create_mix, track_paths, output_path, normalize, tracks, companion, output_format
+        )
 
     def get_duration(self, path: Path) -> float:
         """Get duration of an audio file in seconds.
 
+        Reads the container duration with ffprobe rather than decoding the
+        whole file, which matters for hour-long mixes.
+
         Args:
             path: Path to audio file
 
         Returns:
             Duration in seconds
+
+        Raises:
+            MixerError: If the duration cannot be read
         """
-        audio = self.load_track(path)
-        return len(audio) / 1000
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(path),
+        ]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            return float(result.stdout.strip())
+        except subprocess.CalledProcessError as e:
+            raise MixerError(f"Failed to read duration of {path}: {e.stderr}")
+        except ValueError:
+            raise MixerError(f"Failed to read duration of {path}: {result.stdout!r}")
 
     @staticmethod
     def _format_duration(seconds: float) -> str:
@@ -149,9 +870,8 @@ class AudioMixer:
         Returns:
             Formatted string
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        hours, rem = divmod(int(seconds), 3600)
+        minutes, secs = divmod(rem, 60)
 
         if hours > 0:
             return f"{hours}:{minutes:02d}:{secs:02d}"
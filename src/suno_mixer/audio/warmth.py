@@ -4,22 +4,98 @@ Subtle Boards of Canada-inspired processing: warm, hazy, nostalgic.
 """
 
 import logging
+import os
+import threading
 from pathlib import Path
 
+import numpy as np
 from pedalboard import (
     Chorus,
     Compressor,
     Gain,
-    HighShelfFilter,
-    LowpassFilter,
-    LowShelfFilter,
     Pedalboard,
     Reverb,
 )
 from pedalboard.io import AudioFile
 
+from suno_mixer.audio.dsp import (
+    CHORUS_CENTRE_DELAY_MS,
+    COMPRESSOR_ATTACK_MS,
+    COMPRESSOR_RELEASE_MS,
+    WarmthParams,
+    eq_sos,
+)
+
 logger = logging.getLogger(__name__)
 
+# Frames read per block when streaming audio through the board
+BLOCK_FRAMES = 32768
+
+
+def _build_board(params: WarmthParams) -> Pedalboard:
+    """Build an effects chain for a parameter set.
+
+    The EQ stage runs separately (see eq_sos).
+
+    Args:
+        params: Warmth parameters
+
+    Returns:
+        Configured Pedalboard
+    """
+    return Pedalboard([
+        # Very slow, subtle chorus - tape-like drift
+        Chorus(
+            rate_hz=params.chorus_rate_hz,
+            depth=params.chorus_depth,
+            centre_delay_ms=CHORUS_CENTRE_DELAY_MS,
+            feedback=0.0,
+            mix=params.chorus_mix,
+        ),
+        # Touch of dark reverb - hazy dreaminess
+        Reverb(
+            room_size=params.reverb_room_size,
+            damping=params.reverb_damping,
+            wet_level=params.reverb_wet,
+            dry_level=1.0,
+            width=0.8,
+        ),
+        # Gentle compression for cohesion
+        Compressor(
+            threshold_db=params.compressor_threshold_db,
+            ratio=params.compressor_ratio,
+            attack_ms=COMPRESSOR_ATTACK_MS,
+            release_ms=COMPRESSOR_RELEASE_MS,
+        ),
+        # Makeup gain
+        Gain(gain_db=params.makeup_gain_db),
+    ])
+
+
+# Per-thread board cache keyed by parameters. Boards carry effect state
+# between blocks, so they can be reused across files but never shared
+# between threads.
+_boards = threading.local()
+
+
+def _get_board(params: WarmthParams) -> Pedalboard:
+    """Get the calling thread's cached board for a parameter set.
+
+    Args:
+        params: Warmth parameters
+
+    Returns:
+        Pedalboard owned by the calling thread
+    """
+    cache = getattr(_boards, "cache", None)
+    if cache is None:
+        cache = _boards.cache = {}
+
+    board = cache.get(params)
+    if board is None:
+        board = cache[params] = _build_board(params)
+    return board
+
 
 class WarmthProcessor:
     """Apply analog warmth effects to audio files.
@@ -63,47 +139,90 @@ class WarmthProcessor:
             compressor_ratio: Compressor ratio
             makeup_gain_db: Final makeup gain
         """
-        self.board = Pedalboard([
-            # Warm low-end boost - BoC's rich bass
-            LowShelfFilter(
-                cutoff_frequency_hz=low_shelf_freq_hz,
-                gain_db=low_shelf_gain_db,
-                q=0.6,
-            ),
-            # Roll off harsh highs - tape-like darkness
-            HighShelfFilter(
-                cutoff_frequency_hz=high_shelf_freq_hz,
-                gain_db=high_shelf_gain_db,
-                q=0.6,
-            ),
-            # Gentle lowpass - removes digital edge
-            LowpassFilter(cutoff_frequency_hz=lowpass_freq_hz),
-            # Very slow, subtle chorus - tape-like drift
-            Chorus(
-                rate_hz=chorus_rate_hz,
-                depth=chorus_depth,
-                centre_delay_ms=8.0,
-                feedback=0.0,
-                mix=chorus_mix,
-            ),
-            # Touch of dark reverb - hazy dreaminess
-            Reverb(
-                room_size=reverb_room_size,
-                damping=reverb_damping,
-                wet_level=reverb_wet,
-                dry_level=1.0,
-                width=0.8,
-            ),
-            # Gentle compression for cohesion
-            Compressor(
-                threshold_db=compressor_threshold_db,
-                ratio=compressor_ratio,
-                attack_ms=15,
-                release_ms=150,
-            ),
-            # Makeup gain
-            Gain(gain_db=makeup_gain_db),
-        ])
+        self.params = WarmthParams(
+            low_shelf_gain_db=low_shelf_gain_db,
+            low_shelf_freq_hz=low_shelf_freq_hz,
+            high_shelf_gain_db=high_shelf_gain_db,
+            high_shelf_freq_hz=high_shelf_freq_hz,
+            lowpass_freq_hz=lowpass_freq_hz,
+            chorus_rate_hz=chorus_rate_hz,
+            chorus_depth=chorus_depth,
+            chorus_mix=chorus_mix,
+            reverb_room_size=reverb_room_size,
+            reverb_damping=reverb_damping,
+            reverb_wet=reverb_wet,
+            compressor_threshold_db=compressor_threshold_db,
+            compressor_ratio=compressor_ratio,
+            makeup_gain_db=makeup_gain_db,
+        )
+
+    @property
+    def board(self) -> Pedalboard:
+        """Effects board for the calling thread.
+
+        Built lazily on first use and cached per thread, so process() is
+        safe to call from worker threads.
+        """
+        return _get_board(self.params)
+
+    def _process_stream(self, board: Pedalboard, in_file: AudioFile, out_file: AudioFile) -> None:
+        """Stream audio through the EQ and a board block by block.
+
+        Args:
+            board: Effects chain to apply after the EQ
+            in_file: Open input audio file
+            out_file: Open output audio file
+        """
+        # scipy.signal is slow to import, so defer it until audio is processed
+        from scipy.signal import sosfilt
+
+        samplerate = in_file.samplerate
+        sos = eq_sos(self.params, samplerate)
+        # Keep the EQ in float32 so blocks reach the board without conversion
+        zi = np.zeros((sos.shape[0], in_file.num_channels, 2), dtype=np.float32)
+
+        while True:
+            block = in_file.read(BLOCK_FRAMES)
+            if not block.shape[-1]:
+                break
+            block, zi = sosfilt(sos, block, axis=-1, zi=zi)
+            out_file.write(board.process(block, samplerate, reset=False))
+
+    def _process_file(self, board: Pedalboard, input_path: Path, output_path: Path) -> Path:
+        """Apply a board to one file.
+
+        Args:
+            board: Effects chain to apply
+            input_path: Path to input audio file
+            output_path: Path for output file (may equal input_path)
+
+        Returns:
+            Path to processed audio file
+        """
+        logger.info(f"Applying warmth processing to: {input_path.name}")
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Stream into a sibling file so in-place processing never reads what it writes
+        temp_path = output_path.with_name(f".{output_path.stem}.warmth{output_path.suffix}")
+
+        board.reset()
+        try:
+            with AudioFile(str(input_path)) as in_file:
+                samplerate = in_file.samplerate
+                logger.debug(f"Sample rate: {samplerate}Hz, Duration: {in_file.frames / samplerate:.1f}s")
+
+                with AudioFile(str(temp_path), "w", samplerate, in_file.num_channels) as out_file:
+                    self._process_stream(board, in_file, out_file)
+        except BaseException:
+            # Never leave a partial file behind next to the output
+            temp_path.unlink(missing_ok=True)
+            raise
+
+        os.replace(temp_path, output_path)
+
+        logger.info(f"Warmth processing complete: {output_path.name}")
+        return output_path
 
     def process(self, input_path: Path, output_path: Path | None = None) -> Path:
         """Apply warmth processing to an audio file.
@@ -121,19 +240,4 @@ class WarmthProcessor:
         else:
             output_path = Path(output_path)
 
-        logger.info(f"Applying warmth processing to: {input_path.name}")
-
-        with AudioFile(str(input_path)) as f:
-            audio = f.read(f.frames)
-            samplerate = f.samplerate
-            logger.debug(f"Sample rate: {samplerate}Hz, Duration: {f.frames / samplerate:.1f}s")
-
-        processed = self.board(audio, samplerate)
-
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with AudioFile(str(output_path), 'w', samplerate, processed.shape[0]) as f:
-            f.write(processed)
-
-        logger.info(f"Warmth processing complete: {output_path.name}")
-        return output_path
+        return self._process_file(self.board, input_path, output_path)
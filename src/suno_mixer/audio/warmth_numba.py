@@ -0,0 +1,261 @@
+"""Numba-compiled warmth processing for installs without Pedalboard.
+
+Approximates the Pedalboard chain in a single fused pass per block: the EQ
+cascade, a slow LFO-modulated chorus, and a soft-knee feed-forward
+compressor with makeup gain. Reverb is omitted. Audio is decoded and encoded through ffmpeg.
+"""
+
+import logging
+import math
+import os
+import subprocess
+from pathlib import Path
+
+import numpy as np
+from numba import njit, prange
+
+from suno_mixer.audio.dsp import (
+    CHORUS_CENTRE_DELAY_MS,
+    COMPRESSOR_ATTACK_MS,
+    COMPRESSOR_RELEASE_MS,
+    WarmthParams,
+    eq_sos,
+)
+
+logger = logging.getLogger(__name__)
+
+# ffmpeg decode format for the kernel
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
+# Frames processed per kernel call
+BLOCK_FRAMES = 32768
+
+# Width in dB of the compressor's soft knee, centred on the threshold
+COMPRESSOR_KNEE_DB = 6.0
+
+
+class WarmthError(Exception):
+    """Warmth processing error."""
+
+    pass
+
+
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def process_block(x, sos, zi, delay, env, pos, phase, params):
+    """Run EQ, chorus and compressor over one block in a single pass.
+
+    Channels are processed in parallel. All state arrays are updated in
+    place; the caller advances pos and phase by the block length.
+
+    Args:
+        x: (channels, frames) float32 input block
+        sos: (sections, 6) EQ cascade
+        zi: (sections, channels, 2) EQ filter state
+        delay: (channels, delay_len) chorus delay lines
+        env: (channels,) compressor envelopes
+        pos: Delay line write index at block start
+        phase: Chorus LFO phase (0-1) at block start
+        params: [lfo_step, centre_delay, depth, mix, threshold_db, slope,
+            attack_coef, release_coef, makeup_gain, knee_db]
+
+    Returns:
+        (channels, frames) float32 output block
+    """
+    channels, frames = x.shape
+    sections = sos.shape[0]
+    delay_len = delay.shape[1]
+    lfo_step = params[0]
+    centre = params[1]
+    depth = params[2]
+    mix = params[3]
+    threshold_db = params[4]
+    slope = params[5]
+    attack = params[6]
+    release = params[7]
+    makeup = params[8]
+    knee = params[9]
+
+    y = np.empty_like(x)
+
+    for ch in prange(channels):
+        write = pos
+        lfo = phase
+        level_env = env[ch]
+
+        for i in range(frames):
+            sample = x[ch, i]
+
+            # EQ cascade, direct form II transposed
+            for k in range(sections):
+                out = sos[k, 0] * sample + zi[k, ch, 0]
+                zi[k, ch, 0] = sos[k, 1] * sample - sos[k, 4] * out + zi[k, ch, 1]
+                zi[k, ch, 1] = sos[k, 2] * sample - sos[k, 5] * out
+                sample = out
+
+            # Chorus: fractional delay tap with linear interpolation
+            delay[ch, write] = sample
+            read = write - centre * (1.0 + depth * math.sin(2.0 * math.pi * lfo))
+            if read < 0:
+                read += delay_len
+            j = int(read)
+            frac = read - j
+            j_next = j + 1 if j + 1 < delay_len else 0
+            wet = delay[ch, j] * (1.0 - frac) + delay[ch, j_next] * frac
+            sample = sample * (1.0 - mix) + wet * mix
+
+            write += 1
+            if write == delay_len:
+                write = 0
+            lfo += lfo_step
+            if lfo >= 1.0:
+                lfo -= 1.0
+
+            # Compressor: one-pole envelope follower, quadratic soft knee
+            level = abs(sample)
+            coef = attack if level > level_env else release
+            level_env = coef * level_env + (1.0 - coef) * level
+            gain = makeup
+            if level_env > 1e-9:
+                over_db = 20.0 * math.log10(level_env) - threshold_db
+                if over_db >= 0.5 * knee:
+                    gain *= 10.0 ** (-over_db * slope / 20.0)
+                elif over_db > -0.5 * knee:
+                    knee_db = over_db + 0.5 * knee
+                    gain *= 10.0 ** (-slope * knee_db * knee_db / (2.0 * knee) / 20.0)
+
+            y[ch, i] = sample * gain
+
+        env[ch] = level_env
+
+    return y
+
+
+def _finish(process: subprocess.Popen) -> str:
+    """Close a process's pipes, wait for it to exit and collect its stderr.
+
+    Args:
+        process: ffmpeg process started with a stderr pipe
+
+    Returns:
+        Everything the process wrote to stderr
+    """
+    if process.stdin:
+        try:
+            process.stdin.close()
+        except BrokenPipeError:
+            pass
+    if process.stdout:
+        process.stdout.close()
+    with process.stderr:
+        stderr = process.stderr.read().decode(errors="replace")
+    process.wait()
+    return stderr.strip()
+
+
+class NumbaWarmthProcessor:
+    """Apply analog warmth effects with the Numba kernel.
+
+    Drop-in replacement for WarmthProcessor when Pedalboard is unavailable.
+    """
+
+    def __init__(self, **params):
+        """Initialize processor.
+
+        Args:
+            **params: Same keyword arguments as WarmthProcessor
+        """
+        self.params = WarmthParams(**params)
+
+    def _kernel_params(self) -> np.ndarray:
+        """Pack scalar kernel parameters for the configured sample rate."""
+        params = self.params
+        centre = CHORUS_CENTRE_DELAY_MS * SAMPLE_RATE / 1000
+        attack = math.exp(-1000 / (COMPRESSOR_ATTACK_MS * SAMPLE_RATE))
+        release = math.exp(-1000 / (COMPRESSOR_RELEASE_MS * SAMPLE_RATE))
+        return np.array([
+            params.chorus_rate_hz / SAMPLE_RATE,
+            centre,
+            params.chorus_depth,
+            params.chorus_mix,
+            params.compressor_threshold_db,
+            1 - 1 / params.compressor_ratio,
+            attack,
+            release,
+            10 ** (params.makeup_gain_db / 20),
+            COMPRESSOR_KNEE_DB,
+        ])
+
+    def process(self, input_path: Path, output_path: Path | None = None) -> Path:
+        """Apply warmth processing to an audio file.
+
+        Args:
+            input_path: Path to input audio file
+            output_path: Path for output file. If None, overwrites input.
+
+        Returns:
+            Path to processed audio file
+
+        Raises:
+            WarmthError: If ffmpeg or the kernel fails
+        """
+        input_path = Path(input_path)
+        output_path = input_path if output_path is None else Path(output_path)
+
+        logger.info(f"Applying warmth processing (numba) to: {input_path.name}")
+
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = output_path.with_name(f".{output_path.stem}.warmth{output_path.suffix}")
+
+        raw_format = ["-f", "f32le", "-ac", str(CHANNELS), "-ar", str(SAMPLE_RATE)]
+        decoder = subprocess.Popen(
+            ["ffmpeg", "-v", "error", "-i", str(input_path), *raw_format, "-"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        encoder = subprocess.Popen(
+            ["ffmpeg", "-v", "error", "-y", *raw_format, "-i", "-", str(temp_path)],
+            stdin=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+        sos = eq_sos(self.params, SAMPLE_RATE)
+        kernel_params = self._kernel_params()
+        delay_len = int(math.ceil(kernel_params[1] * (1 + self.params.chorus_depth))) + 2
+        zi = np.zeros((sos.shape[0], CHANNELS, 2), dtype=np.float32)
+        delay = np.zeros((CHANNELS, delay_len), dtype=np.float32)
+        env = np.zeros(CHANNELS, dtype=np.float32)
+        pos = 0
+        phase = 0.0
+
+        failure = None
+        try:
+            while data := decoder.stdout.read(BLOCK_FRAMES * CHANNELS * 4):
+                block = np.frombuffer(data, dtype=np.float32).reshape(-1, CHANNELS)
+                frames = len(block)
+                out = process_block(
+                    np.ascontiguousarray(block.T), sos, zi, delay, env, pos, phase, kernel_params
+                )
+                encoder.stdin.write(out.T.tobytes())
+                pos = (pos + frames) % delay_len
+                phase = (phase + frames * kernel_params[0]) % 1.0
+        except BaseException as e:
+            # Stop both ffmpegs so neither blocks on a pipe nobody serves
+            failure = e
+            decoder.kill()
+            encoder.kill()
+
+        errors = "\n".join(filter(None, (_finish(decoder), _finish(encoder))))
+
+        if failure is not None or decoder.returncode or encoder.returncode:
+            temp_path.unlink(missing_ok=True)
+            if not isinstance(failure, (Exception, type(None))):
+                raise failure
+            raise WarmthError(
+                f"Warmth processing of {input_path} failed: {errors or failure or 'ffmpeg error'}"
+            ) from failure
+
+        os.replace(temp_path, output_path)
+
+        logger.info(f"Warmth processing complete: {output_path.name}")
+        return output_path
@@ -11,16 +11,13 @@ from rich.logging import RichHandler
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.table import Table
 
-from suno_mixer.config import load_config
-from suno_mixer.pipeline.orchestrator import MixPipeline
 from suno_mixer.presets import GENRE_PRESETS, MOOD_WORDS
 
 
 def format_duration(seconds: float) -> str:
     """Format duration as HH:MM:SS or MM:SS."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
     if hours > 0:
         return f"{hours}:{minutes:02d}:{secs:02d}"
     return f"{minutes}:{secs:02d}"
@@ -29,6 +26,15 @@ def format_duration(seconds: float) -> str:
 console = Console()
 
 
+def run_async(coro):
+    """Run a coroutine, using uvloop's event loop where available."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    return uvloop.run(coro)
+
+
 def setup_logging(verbose: bool = False):
     """Setup logging with Rich handler."""
     level = logging.DEBUG if verbose else logging.INFO
@@ -67,16 +73,21 @@ def generate(ctx, mood, genre, tracks, output):
 
     preset = GENRE_PRESETS[genre]
     console.print(f"  [bold]Mood:[/bold]   {mood.upper()}")
-    console.print(f"  [bold]Genre:[/bold]  {preset['name']} ({preset['bpm']} BPM)")
+    console.print(f"  [bold]Genre:[/bold]  {preset.name} ({preset.bpm} BPM)")
     console.print(f"  [bold]Tracks:[/bold] {tracks}\n")
 
     try:
+        from suno_mixer.config import load_config
+        from suno_mixer.pipeline.orchestrator import MixPipeline
+
         config = load_config()
 
+        # load_config is cached, so overrides go on copies rather than the shared instance
         if output:
-            config.pipeline.output_directory = Path(output)
-
-        pipeline = MixPipeline(config)
+            pipeline_config = config.pipeline.model_copy(
+                update={"output_directory": Path(output)}
+            )
+            config = config.model_copy(update={"pipeline": pipeline_config})
 
         # Run the async pipeline
         with Progress(
@@ -90,14 +101,16 @@ def generate(ctx, mood, genre, tracks, output):
             def on_progress(phase, message):
                 progress.update(task, description=f"[cyan]{message}")
 
-            result = asyncio.run(
-                pipeline.generate(
-                    mood=mood,
-                    genre=genre,
-                    track_count=tracks,
-                    on_progress=on_progress,
-                )
-            )
+            async def run_pipeline():
+                async with MixPipeline(config) as pipeline:
+                    return await pipeline.generate(
+                        mood=mood,
+                        genre=genre,
+                        track_count=tracks,
+                        on_progress=on_progress,
+                    )
+
+            result = run_async(run_pipeline())
 
         # Print results
         console.print("\n[bold green]Complete![/bold green]\n")
@@ -141,8 +154,8 @@ def list_genres():
     for key, preset in GENRE_PRESETS.items():
         table.add_row(
             key,
-            preset["name"],
-            str(preset["bpm"]),
+            preset.name,
+            str(preset.bpm),
         )
 
     console.print(table)
@@ -176,11 +189,13 @@ def thumbnail(output):
     console.print(f"  Output: {output}\n")
 
     try:
-        config = load_config()
+        from suno_mixer.config import load_config
         from suno_mixer.thumbnail import ThumbnailGenerator
 
+        config = load_config()
+
         generator = ThumbnailGenerator(config.thumbnail)
-        result = asyncio.run(generator.generate(Path(output)))
+        result = run_async(generator.generate(Path(output)))
 
         console.print(f"[green]Thumbnail saved:[/green] {result}")
 
@@ -217,12 +232,14 @@ def mix(input_dir, output, crossfade):
     console.print(f"  Output: {output}\n")
 
     try:
-        config = load_config()
-        config.mixer.crossfade_duration_ms = crossfade * 1000
-
         from suno_mixer.audio.mixer import AudioMixer
+        from suno_mixer.config import load_config
+
+        mixer_config = load_config().mixer.model_copy(
+            update={"crossfade_duration_ms": crossfade * 1000}
+        )
 
-        mixer = AudioMixer(config.mixer)
+        mixer = AudioMixer(mixer_config)
         result = mixer.create_mix(tracks, output_path)
 
         console.print(f"[green]Mix saved:[/green] {result}")
@@ -278,7 +295,7 @@ def publish(ctx, mix_path, privacy, secrets):
 
     # Find video and thumbnail files
     video_files = list(mix_dir.glob("*.mp4"))
-    thumb_files = list(mix_dir.glob("*_yt_thumb.png"))
+    thumb_files = list(mix_dir.glob("*_yt_thumb.*"))
 
     if not video_files:
         console.print(f"[red]No video file found in {mix_dir}[/red]")
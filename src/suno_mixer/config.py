@@ -1,5 +1,6 @@
 """Configuration management using Pydantic Settings."""
 
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import Field
@@ -15,7 +16,8 @@ class SunoConfig(BaseSettings):
     model: str = "V5"
     custom_mode: bool = True
     instrumental: bool = True
-    poll_interval_seconds: int = 30
+    poll_interval_seconds: float = 5  # First status poll delay, grown by POLL_BACKOFF
+    max_poll_interval_seconds: float = 30
     timeout_seconds: int = 600
     max_concurrent: int = 10
 
@@ -26,6 +28,7 @@ class MixerConfig(BaseSettings):
     transition_type: str = "cut"  # "cut" for clean cuts, "crossfade" for crossfades
     crossfade_duration_ms: int = 3000  # Only used if transition_type is "crossfade"
     target_loudness_dbfs: float = -14.0
+    normalization: str = "loudnorm"  # "loudnorm" for two-pass EBU R128, "dbfs" for simple gain
     output_format: str = "mp3"
     output_bitrate: str = "320k"
 
@@ -46,6 +49,11 @@ class VideoConfig(BaseSettings):
     codec: str = "libx264"
     preset: str = "medium"
     crf: int = 18
+    # Opt-in: swap libx264 for a working GPU H.264 encoder. Much faster, but it
+    # encodes at a fixed hardware_bitrate instead of CRF quality, so output
+    # differs from host to host
+    hardware_encoder: bool = False
+    hardware_bitrate: str = "6M"  # Hardware encoders take a bitrate, not a CRF
     audio_codec: str = "aac"
     audio_bitrate: str = "320k"
 
@@ -88,6 +96,7 @@ class PipelineConfig(BaseSettings):
     output_directory: Path = Path("./output")
     temp_directory: Path = Path("./temp")
     cleanup_temp: bool = True
+    max_concurrent_downloads: int = 32
 
 
 class Config(BaseSettings):
@@ -108,6 +117,12 @@ class Config(BaseSettings):
     pipeline: PipelineConfig = Field(default_factory=PipelineConfig)
 
 
+@lru_cache(maxsize=1)
 def load_config() -> Config:
-    """Load configuration from environment and defaults."""
+    """Load configuration from environment and defaults.
+
+    The result is cached, so the environment and .env file are read once
+    per process and every caller shares the same Config instance. Treat it
+    as read-only and apply overrides to model_copy(update=...) copies.
+    """
     return Config()
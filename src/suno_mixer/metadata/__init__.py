@@ -4,16 +4,22 @@ from suno_mixer.metadata.youtube import (
     YouTubeTitleGenerator,
     format_duration,
     generate_hashtags,
+    generate_keywords,
     generate_tags,
     generate_youtube_description,
     generate_youtube_title,
+    generate_youtube_title_from_template,
+    generate_youtube_titles_from_template,
 )
 
 __all__ = [
     "format_duration",
     "generate_hashtags",
+    "generate_keywords",
     "generate_tags",
     "generate_youtube_description",
     "generate_youtube_title",
+    "generate_youtube_title_from_template",
+    "generate_youtube_titles_from_template",
     "YouTubeTitleGenerator",
 ]
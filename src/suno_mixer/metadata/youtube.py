@@ -2,15 +2,39 @@
 
 import logging
 import random
+import string
+from functools import lru_cache
+from itertools import accumulate
+from typing import TYPE_CHECKING, Callable
 
-from suno_mixer.config import ThumbnailConfig
-from suno_mixer.presets import YOUTUBE_TITLE_SYSTEM_PROMPT
+from suno_mixer.presets import render_youtube_title_prompt
+
+if TYPE_CHECKING:
+    from suno_mixer.config import ThumbnailConfig
 
 logger = logging.getLogger(__name__)
 
 NEWSLETTER_LINK = "https://newsletter.owainlewis.com/subscribe"
 SKOOL_LINK = "https://skool.com/aiengineer/about"
 
+# Description layout; links are fixed, the rest is filled per mix
+DESCRIPTION_TEMPLATE = f"""FREE AI engineering tutorials: {NEWSLETTER_LINK}
+
+---
+
+{{duration}} of {{genre}}. {{vibe}}
+
+Perfect for deep coding sessions, technical problem-solving, system design, and late-night hacking.
+
+Tracklist:
+{{tracklist}}
+
+Join the best AI engineering community, earn more, build real automated systems: {SKOOL_LINK}
+
+{{hashtags}}
+
+{{keywords}}"""
+
 # Genre-specific vibe descriptions
 GENRE_VIBES = {
     "Dark Synthwave": "Dark, atmospheric synthwave with neon-lit highways and retro-futuristic energy to suppress distractions and fuel your late-night coding sessions.",
@@ -21,6 +45,13 @@ GENRE_VIBES = {
     "Neo Classical": "Emotional piano melodies and subtle strings that inspire creativity while maintaining deep focus.",
 }
 
+DEFAULT_VIBE = (
+    "Atmospheric electronic music designed for peak cognitive performance and deep focus."
+)
+
+# genre_name -> (vibe description, hashtag form of the name)
+_GENRE_META = {name: (vibe, name.replace(" ", "")) for name, vibe in GENRE_VIBES.items()}
+
 # Power words for title hooks
 TITLE_HOOKS = [
     "Ultrahuman Focus",
@@ -75,11 +106,91 @@ TITLE_TEMPLATES = [
     "Developer Vibes | {genre} | {hook}",
 ]
 
+# Constant parts of tags, hashtags and keywords; genre and mood are added per call
+_BASE_TAGS = (
+    "coding music",
+    "programming music",
+    "deep work music",
+    "focus music",
+    "study music",
+    "concentration music",
+    "work music",
+    "productivity music",
+)
+_AUDIENCE_TAGS = (
+    "music for coding",
+    "music for programming",
+    "developer music",
+    "software engineer music",
+)
+_BASE_HASHTAGS = " ".join((
+    "#CodingMusic",
+    "#DeepWork",
+    "#ProgrammingMusic",
+    "#FocusMusic",
+    "#StudyMusic",
+    "#AIEngineer",
+    "#ProductivityMusic",
+))
+_BASE_KEYWORDS = ", ".join((
+    "coding music",
+    "programming music",
+    "deep work",
+    "focus music for coding",
+    "study music",
+    "concentration music",
+))
+_AUDIENCE_KEYWORDS = ", ".join((
+    "music for programmers",
+    "developer playlist",
+    "software engineer music",
+    "work from home music",
+    "lo-fi coding",
+    "ambient coding music",
+))
+_PLAYLIST_KEYWORDS = ", ".join((
+    "productivity playlist",
+    "music for deep focus",
+    "coding playlist",
+    "hacking music",
+    "late night coding",
+    "flow state music",
+))
+
+# Positional argument index for each template field
+TEMPLATE_FIELDS = {"hook": 0, "genre": 1, "duration": 2}
+
+
+def _compile_template(template: str) -> Callable[[str, str, int], str]:
+    """Parse a title template once into a render function.
+
+    Args:
+        template: Title template using {hook}, {genre} and {duration}
+
+    Returns:
+        Function taking (hook, genre, duration) and returning the title
+    """
+    pieces = tuple(
+        (literal, TEMPLATE_FIELDS[field] if field is not None else None)
+        for literal, field, _, _ in string.Formatter().parse(template)
+    )
+
+    def render(*values) -> str:
+        return "".join(
+            literal if index is None else f"{literal}{values[index]}"
+            for literal, index in pieces
+        )
+
+    return render
+
+
+_COMPILED_TEMPLATES = [_compile_template(template) for template in TITLE_TEMPLATES]
+
 
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to human-readable string."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
+    hours, rem = divmod(int(seconds), 3600)
+    minutes = rem // 60
 
     if hours > 0:
         return f"{hours} Hour{'s' if hours > 1 else ''} {minutes} Minutes"
@@ -108,20 +219,40 @@ def generate_youtube_title_from_template(
     Returns:
         A formatted YouTube title
     """
-    template = random.choice(TITLE_TEMPLATES)
+    render = _COMPILED_TEMPLATES[random.randrange(len(_COMPILED_TEMPLATES))]
     hook = random.choice(TITLE_HOOKS)
 
-    return template.format(
-        hook=hook,
-        genre=genre_name,
-        duration=duration_hours,
-    )
+    return render(hook, genre_name, duration_hours)
+
+
+def generate_youtube_titles_from_template(
+    count: int,
+    genre_name: str,
+    duration_hours: int = 2,
+) -> list[str]:
+    """Generate several template-based YouTube titles at once.
+
+    Templates and hooks are sampled in one call each, which is cheaper than
+    calling generate_youtube_title_from_template in a loop.
+
+    Args:
+        count: Number of titles to generate
+        genre_name: Human-readable genre name
+        duration_hours: Duration in hours for the titles
+
+    Returns:
+        List of formatted YouTube titles
+    """
+    renders = random.choices(_COMPILED_TEMPLATES, k=count)
+    hooks = random.choices(TITLE_HOOKS, k=count)
+
+    return [render(hook, genre_name, duration_hours) for render, hook in zip(renders, hooks)]
 
 
 class YouTubeTitleGenerator:
     """Generate YouTube titles using AI with template fallback."""
 
-    def __init__(self, config: ThumbnailConfig):
+    def __init__(self, config: "ThumbnailConfig"):
         """Initialize generator.
 
         Args:
@@ -160,7 +291,7 @@ class YouTubeTitleGenerator:
             return self._fallback_generate(genre_name, duration_hours)
 
         try:
-            prompt = YOUTUBE_TITLE_SYSTEM_PROMPT.format(
+            prompt = render_youtube_title_prompt(
                 genre_name=genre_name,
                 mood=mood,
                 duration_hours=duration_hours,
@@ -211,114 +342,72 @@ def generate_youtube_description(
 ) -> str:
     """Generate full YouTube description per SOP structure."""
 
-    vibe_description = GENRE_VIBES.get(
-        genre_name,
-        "Atmospheric electronic music designed for peak cognitive performance and deep focus.",
-    )
-
-    # Build tracklist with timestamps
-    tracklist_lines = []
-    current_time = 0
-    for track in tracks:
-        hours = int(current_time // 3600)
-        minutes = int((current_time % 3600) // 60)
-        seconds = int(current_time % 60)
+    vibe_description = _GENRE_META.get(genre_name, (DEFAULT_VIBE,))[0]
 
-        if hours > 0:
-            timestamp = f"{hours}:{minutes:02d}:{seconds:02d}"
-        else:
-            timestamp = f"{minutes}:{seconds:02d}"
+    # Build tracklist with timestamps from cumulative start times
+    durations = (track.get("duration", 180) for track in tracks)  # Default 3 min if not specified
+    starts = accumulate(durations, initial=0.0)
 
-        tracklist_lines.append(f"{timestamp} - {track['title']}")
-        current_time += track.get("duration", 180)  # Default 3 min if not specified
-
-    tracklist = "\n".join(tracklist_lines)
+    tracklist = "\n".join(
+        f"{_timestamp(int(start))} - {track['title']}" for start, track in zip(starts, tracks)
+    )
 
     hashtags = generate_hashtags(mood, genre_name)
     keywords = generate_keywords(mood, genre_name)
 
-    description = f"""FREE AI engineering tutorials: {NEWSLETTER_LINK}
-
----
-
-{duration_formatted} of {genre_name}. {vibe_description}
-
-Perfect for deep coding sessions, technical problem-solving, system design, and late-night hacking.
+    return DESCRIPTION_TEMPLATE.format(
+        duration=duration_formatted,
+        genre=genre_name,
+        vibe=vibe_description,
+        tracklist=tracklist,
+        hashtags=hashtags,
+        keywords=keywords,
+    )
 
-Tracklist:
-{tracklist}
 
-Join the best AI engineering community, earn more, build real automated systems: {SKOOL_LINK}
+def generate_tags(mood: str, genre_name: str) -> list[str]:
+    """Generate YouTube tags for the video."""
+    genre = genre_name.lower()
+    mood = mood.lower()
+    return [
+        *_BASE_TAGS,
+        genre,
+        f"{genre} mix",
+        *_AUDIENCE_TAGS,
+        mood,
+        f"{mood} music",
+    ]
 
-{hashtags}
 
-{keywords}"""
+@lru_cache(maxsize=4096)
+def _timestamp(seconds: int) -> str:
+    """Format a tracklist offset as M:SS or H:MM:SS.
 
-    return description
+    Cached because mixes of similar length produce the same offsets.
+    """
+    hours, rem = divmod(seconds, 3600)
+    minutes, secs = divmod(rem, 60)
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes}:{secs:02d}"
 
 
-def generate_tags(mood: str, genre_name: str) -> list[str]:
-    """Generate YouTube tags for the video."""
-    base_tags = [
-        "coding music",
-        "programming music",
-        "deep work music",
-        "focus music",
-        "study music",
-        "concentration music",
-        "work music",
-        "productivity music",
-        genre_name.lower(),
-        f"{genre_name.lower()} mix",
-        "music for coding",
-        "music for programming",
-        "developer music",
-        "software engineer music",
-        mood.lower(),
-        f"{mood.lower()} music",
-    ]
-    return base_tags
+@lru_cache(maxsize=32)
+def _mood_title(mood: str) -> str:
+    """Title-case a mood word; the same few moods recur across mixes."""
+    return mood.title()
 
 
 def generate_hashtags(mood: str, genre_name: str) -> str:
     """Generate hashtag string for description."""
-    hashtags = [
-        "#CodingMusic",
-        "#DeepWork",
-        "#ProgrammingMusic",
-        "#FocusMusic",
-        "#StudyMusic",
-        "#AIEngineer",
-        "#ProductivityMusic",
-        f"#{genre_name.replace(' ', '')}",
-        f"#{mood.title()}",
-        "#TechMusic",
-    ]
-    return " ".join(hashtags)
+    genre_meta = _GENRE_META.get(genre_name)
+    genre_tag = genre_meta[1] if genre_meta else genre_name.replace(" ", "")
+    return f"{_BASE_HASHTAGS} #{genre_tag} #{_mood_title(mood)} #TechMusic"
 
 
 def generate_keywords(mood: str, genre_name: str) -> str:
     """Generate comma-separated keywords for SEO."""
-    keywords = [
-        "coding music",
-        "programming music",
-        "deep work",
-        "focus music for coding",
-        "study music",
-        "concentration music",
-        f"{genre_name.lower()} for coding",
-        "music for programmers",
-        "developer playlist",
-        "software engineer music",
-        "work from home music",
-        "lo-fi coding",
-        "ambient coding music",
-        f"{mood.lower()} music",
-        "productivity playlist",
-        "music for deep focus",
-        "coding playlist",
-        "hacking music",
-        "late night coding",
-        "flow state music",
-    ]
-    return ", ".join(keywords)
+    return (
+        f"{_BASE_KEYWORDS}, {genre_name.lower()} for coding, {_AUDIENCE_KEYWORDS}, "
+        f"{mood.lower()} music, {_PLAYLIST_KEYWORDS}"
+    )
@@ -1,11 +1,18 @@
 """Data models for Suno Mixer."""
 
-from datetime import datetime
-from enum import Enum
+from datetime import datetime, timezone
+from enum import Enum, IntEnum
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import AliasGenerator, BaseModel, ConfigDict, Field, TypeAdapter
+from pydantic.alias_generators import to_camel
+
+UTC = timezone.utc
+
+# Track title -> filename-safe stem
+FILENAME_TABLE = str.maketrans({" ": "_"})
 
 
 class TaskStatus(str, Enum):
@@ -21,9 +28,36 @@ class TaskStatus(str, Enum):
     SENSITIVE_WORD_ERROR = "SENSITIVE_WORD_ERROR"
 
 
+# Raw API status string -> TaskStatus, avoiding Enum construction per lookup
+STATUS_LOOKUP = {status.value: status for status in TaskStatus}
+
+
+class TaskStatusCode(IntEnum):
+    """Integer mirror of TaskStatus for internal state checks.
+
+    Ordered so pending states sort below SUCCESS and failures above it,
+    letting status checks compare a single integer.
+    """
+
+    PENDING = 0
+    TEXT_SUCCESS = 1
+    FIRST_SUCCESS = 2
+    SUCCESS = 3
+    CREATE_TASK_FAILED = 4
+    GENERATE_AUDIO_FAILED = 5
+    CALLBACK_EXCEPTION = 6
+    SENSITIVE_WORD_ERROR = 7
+
+
+# Raw API status string -> TaskStatusCode
+STATUS_CODES = {status.value: TaskStatusCode[status.name] for status in TaskStatus}
+
+
 class TrackRequest(BaseModel):
     """Request to generate a single track."""
 
+    model_config = ConfigDict(frozen=True)
+
     prompt: str
     style: str
     title: str
@@ -34,15 +68,23 @@ class SunoTrackData(BaseModel):
     """Track data from Suno API response."""
 
     id: str
-    audio_url: str = Field(alias="audioUrl")
-    stream_audio_url: Optional[str] = Field(default=None, alias="streamAudioUrl")
-    image_url: Optional[str] = Field(default=None, alias="imageUrl")
+    audio_url: str
+    stream_audio_url: Optional[str] = None
+    image_url: Optional[str] = None
     title: str
     tags: Optional[str] = None
     duration: float
 
-    class Config:
-        populate_by_name = True
+    # API fields are camelCase (audioUrl, streamAudioUrl, imageUrl)
+    model_config = ConfigDict(
+        frozen=True,
+        populate_by_name=True,
+        alias_generator=AliasGenerator(validation_alias=to_camel),
+    )
+
+
+# Validates a whole sunoData list in one call
+TRACK_LIST_ADAPTER = TypeAdapter(list[SunoTrackData])
 
 
 class GenerateResponse(BaseModel):
@@ -66,57 +108,54 @@ class GenerateResponse(BaseModel):
 
 
 class TaskStatusResponse(BaseModel):
-    """Response from Suno task status endpoint."""
+    """Response from Suno task status endpoint.
+
+    status and tracks are parsed once per response and cached, since
+    polling checks several properties on the same response.
+    """
 
     code: int
     msg: str
     data: Optional[dict] = None
 
-    @property
+    @cached_property
     def status(self) -> Optional[TaskStatus]:
         """Extract status from response."""
         if self.data:
-            status_str = self.data.get("status")
-            if status_str:
-                try:
-                    return TaskStatus(status_str)
-                except ValueError:
-                    return None
+            return STATUS_LOOKUP.get(self.data.get("status"))
+        return None
+
+    @cached_property
+    def status_code(self) -> Optional[TaskStatusCode]:
+        """Integer form of status for state checks."""
+        if self.data:
+            return STATUS_CODES.get(self.data.get("status"))
         return None
 
     @property
     def is_complete(self) -> bool:
         """Check if task is complete."""
-        return self.status == TaskStatus.SUCCESS
+        return self.status_code == TaskStatusCode.SUCCESS
 
     @property
     def is_failed(self) -> bool:
         """Check if task failed."""
-        if self.status:
-            return self.status in [
-                TaskStatus.CREATE_TASK_FAILED,
-                TaskStatus.GENERATE_AUDIO_FAILED,
-                TaskStatus.CALLBACK_EXCEPTION,
-                TaskStatus.SENSITIVE_WORD_ERROR,
-            ]
-        return False
+        code = self.status_code
+        return code is not None and code >= TaskStatusCode.CREATE_TASK_FAILED
 
     @property
     def is_pending(self) -> bool:
         """Check if task is still pending."""
-        return self.status in [
-            TaskStatus.PENDING,
-            TaskStatus.TEXT_SUCCESS,
-            TaskStatus.FIRST_SUCCESS,
-        ]
+        code = self.status_code
+        return code is not None and code < TaskStatusCode.SUCCESS
 
-    @property
+    @cached_property
     def tracks(self) -> list[SunoTrackData]:
         """Extract track data from response."""
         if self.data and "response" in self.data:
             response = self.data["response"]
             if "sunoData" in response:
-                return [SunoTrackData(**track) for track in response["sunoData"]]
+                return TRACK_LIST_ADAPTER.validate_python(response["sunoData"])
         return []
 
     @property
@@ -130,6 +169,8 @@ class TaskStatusResponse(BaseModel):
 class TrackResult(BaseModel):
     """Result of a track generation."""
 
+    model_config = ConfigDict(frozen=True)
+
     task_id: str
     title: str
     audio_url: str
@@ -137,9 +178,80 @@ class TrackResult(BaseModel):
     image_url: Optional[str] = None
 
 
+class MixCopy(BaseModel):
+    """Text for a mix generated in a single structured LLM call."""
+
+    track_titles: list[str]
+    youtube_title: str = ""
+    thumbnail_prompt: str = ""
+
+
+class RunPaths(BaseModel):
+    """Every output and temp path for one pipeline run, computed once."""
+
+    model_config = ConfigDict(frozen=True)
+
+    name: str
+    run_dir: Path
+    temp_dir: Path
+    tracks_dir: Path
+    thumbnail: Path
+    audio: Path
+    raw_mix: Path
+    video_audio: Path
+    video: Path
+    metadata: Path
+
+    @classmethod
+    def build(
+        cls, output_dir: Path, temp_dir: Path, mood: str, genre: str, timestamp: str
+    ) -> "RunPaths":
+        """Derive all paths for a run from its mood, genre and timestamp.
+
+        Args:
+            output_dir: Root directory for final outputs
+            temp_dir: Root directory for intermediate files
+            mood: Mix mood
+            genre: Genre key
+            timestamp: Run timestamp, keeps names unique
+
+        Returns:
+            RunPaths for the run
+        """
+        name = f"{mood.lower()}_{genre}_{timestamp}"
+        run_dir = output_dir / name
+        run_temp_dir = temp_dir / name
+        return cls(
+            name=name,
+            run_dir=run_dir,
+            temp_dir=run_temp_dir,
+            tracks_dir=run_temp_dir / "tracks",
+            thumbnail=run_dir / f"{name}_thumb.png",
+            audio=run_dir / f"{name}.mp3",
+            raw_mix=run_temp_dir / f"{name}_mix.wav",
+            video_audio=run_temp_dir / f"{name}_video.mka",
+            video=run_dir / f"{name}.mp4",
+            metadata=run_dir / f"{name}.json",
+        )
+
+    def track(self, index: int, title: str) -> Path:
+        """Path for a downloaded track.
+
+        Args:
+            index: Zero-based track position in the mix
+            title: Track title
+
+        Returns:
+            Path inside tracks_dir
+        """
+        return self.tracks_dir / f"{index + 1:02d}_{title.translate(FILENAME_TABLE)}.mp3"
+
+
 class MixOutput(BaseModel):
     """Output of a complete mix generation."""
 
+    model_config = ConfigDict(frozen=True)
+
     video_path: Path
     thumbnail_path: Path
     audio_path: Path
@@ -148,12 +260,14 @@ class MixOutput(BaseModel):
     genre: str
     track_count: int
     total_duration: float
-    generated_at: datetime = Field(default_factory=datetime.utcnow)
+    generated_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
 
 class MixMetadata(BaseModel):
     """Metadata for a generated mix."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     description: str
     tags: list[str]
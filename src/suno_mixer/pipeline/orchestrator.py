@@ -1,16 +1,15 @@
 """Pipeline orchestrator for complete mix generation."""
 
 import asyncio
-import json
 import logging
-from datetime import datetime
+import os
+import shutil
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Awaitable, Optional
+
+import aiofiles
 
-from suno_mixer.audio.downloader import download_tracks
-from suno_mixer.audio.mixer import AudioMixer
-from suno_mixer.audio.warmth import WarmthProcessor
-from suno_mixer.config import Config
 from suno_mixer.metadata import (
     YouTubeTitleGenerator,
     format_duration,
@@ -18,15 +17,22 @@ from suno_mixer.metadata import (
     generate_tags,
     generate_youtube_description,
 )
-from suno_mixer.models import MixMetadata, MixOutput, TrackRequest
-from suno_mixer.presets import GENRE_PRESETS
-from suno_mixer.suno.client import SunoClient
-from suno_mixer.thumbnail import ThumbnailGenerator
-from suno_mixer.titles import TitleGenerator
-from suno_mixer.video.composer import VideoComposer
+from suno_mixer.models import MixMetadata, MixOutput, RunPaths, TrackRequest
+from suno_mixer.presets import get_preset
+
+# Audio, video and API components pull in numpy, pydub, Pillow and aiohttp,
+# so they are imported when a pipeline is built rather than at module load
+if TYPE_CHECKING:
+    import numpy as np
+
+    from suno_mixer.config import Config
+    from suno_mixer.suno.client import SunoClient
 
 logger = logging.getLogger(__name__)
 
+# Typical Suno track length, used to estimate mix duration before generation
+ESTIMATED_TRACK_SECONDS = 180
+
 
 class PipelineError(Exception):
     """Pipeline error."""
@@ -35,18 +41,33 @@ class PipelineError(Exception):
 
 
 class MixPipeline:
-    """Orchestrate the complete mix generation pipeline."""
+    """Orchestrate the complete mix generation pipeline.
 
-    def __init__(self, config: Config):
+    The Suno session is shared by every generate() call. Use the pipeline
+    as an async context manager, or call close(), to release it. A client
+    passed in is left open for its owner, so several pipelines can share
+    one connection pool.
+    """
+
+    def __init__(self, config: "Config", suno: Optional["SunoClient"] = None):
         """Initialize pipeline.
 
         Args:
             config: Application configuration
+            suno: Shared Suno client; one is created and owned if omitted
         """
+        from suno_mixer.audio import WarmthProcessor
+        from suno_mixer.audio.mixer import AudioMixer
+        from suno_mixer.suno.client import SunoClient
+        from suno_mixer.thumbnail import ThumbnailGenerator
+        from suno_mixer.titles import TitleGenerator
+        from suno_mixer.video.composer import VideoComposer
+
         self.config = config
 
         # Initialize components
-        self.suno = SunoClient(config.suno)
+        self._owns_suno = suno is None
+        self.suno = suno or SunoClient(config.suno)
         self.mixer = AudioMixer(config.mixer)
         self.warmth = WarmthProcessor()
         self.thumbnail_gen = ThumbnailGenerator(config.thumbnail)
@@ -58,6 +79,177 @@ class MixPipeline:
         self.output_dir = Path(config.pipeline.output_directory)
         self.temp_dir = Path(config.pipeline.temp_directory)
 
+        # Background temp-dir removals, held so they aren't garbage collected
+        self._pending_cleanups: set[asyncio.Task] = set()
+
+    async def close(self) -> None:
+        """Close the Suno session and wait for background temp-dir cleanups."""
+        if self._owns_suno:
+            await self.suno.close()
+        if self._pending_cleanups:
+            await asyncio.gather(*self._pending_cleanups)
+
+    async def __aenter__(self) -> "MixPipeline":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    async def _download_and_decode(
+        self, urls: list[str], paths: list[Path]
+    ) -> Optional[list["np.ndarray"]]:
+        """Download tracks and prepare each for mixing as soon as it lands.
+
+        Downloads are network-bound and decoding is CPU-bound, so a bounded
+        queue between them lets each track be decoded and loudness-normalized
+        while later tracks download, leaving only the final concatenation for
+        the mix step. Tracks are only decoded when the mixer uses them.
+
+        All downloads share one session whose connector pool allows
+        max_concurrent_downloads connections, so it bounds concurrency the
+        way a semaphore would while reusing TCP and TLS connections.
+
+        Args:
+            urls: Track audio URLs
+            paths: Download paths (same order as urls)
+
+        Returns:
+            Normalized sample arrays in the same order as urls, or None
+
+        Raises:
+            PipelineError: If any download or normalization step fails
+        """
+        from suno_mixer.audio.downloader import create_session, download_file
+        from suno_mixer.audio.mixer import MixerError
+
+        queue: asyncio.Queue[Optional[Path]] = asyncio.Queue(maxsize=2)
+        workers = min(len(paths), os.cpu_count() or 1)
+        indexes = {path: i for i, path in enumerate(paths)}
+        tracks = [None] * len(paths) if self.mixer.decodes_tracks else None
+
+        async def produce() -> None:
+            # Downloads run in their own task group, so a failure here or in a
+            # consumer cancels and awaits the rest before temp files go away
+            try:
+                async with (
+                    create_session(self.config.pipeline.max_concurrent_downloads) as session,
+                    asyncio.TaskGroup() as downloads,
+                ):
+                    pending = [
+                        downloads.create_task(download_file(session, url, path))
+                        for url, path in zip(urls, paths)
+                    ]
+                    for download in asyncio.as_completed(pending):
+                        await queue.put(await download)
+            except ExceptionGroup as e:
+                raise PipelineError(f"Track download failed: {e.exceptions[0]}") from e
+            for _ in range(workers):
+                await queue.put(None)
+
+        async def consume() -> None:
+            while (path := await queue.get()) is not None:
+                if tracks is None:
+                    continue
+                try:
+                    tracks[indexes[path]] = await self.mixer.loudnorm_async(path)
+                except MixerError as e:
+                    raise PipelineError(f"Track normalization failed for {path.name}: {e}") from e
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                group.create_task(produce())
+                for _ in range(workers):
+                    group.create_task(consume())
+        except ExceptionGroup as e:
+            error = e.exceptions[0]
+            if isinstance(error, PipelineError):
+                raise error from None
+            raise PipelineError(f"Track download/normalization failed: {error}") from error
+
+        logger.info(f"Downloaded {len(paths)} tracks")
+        return tracks
+
+    async def _produce_audio(
+        self,
+        track_requests: Awaitable[list[TrackRequest]],
+        paths: RunPaths,
+        on_progress: Optional[callable] = None,
+    ) -> tuple[list, float]:
+        """Generate, download and mix the tracks for one run, then add warmth.
+
+        Args:
+            track_requests: Tracks to generate, awaited once titles are ready
+            paths: Paths for the run
+            on_progress: Optional progress callback
+
+        Returns:
+            (generated tracks, mix duration in seconds)
+        """
+        # Phase 2: Generate tracks. The client's session lives as long as the
+        # pipeline, so later runs reuse its pooled connections.
+        def track_status(task_id, title, status):
+            if on_progress:
+                on_progress("track_status", f"{title}: {status}")
+
+        tracks = await self.suno.generate_tracks_parallel(
+            await track_requests, on_status=track_status
+        )
+
+        if on_progress:
+            on_progress("download", f"Downloading {len(tracks)} tracks")
+
+        # Phase 3: Download tracks, decoding and normalizing each as it lands
+        track_urls = [t.audio_url for t in tracks]
+        track_paths = [paths.track(i, t.title) for i, t in enumerate(tracks)]
+        track_arrays = await self._download_and_decode(track_urls, track_paths)
+
+        if on_progress:
+            on_progress("mix", "Mixing audio tracks")
+
+        # Phase 4: Mix audio off the event loop so the thumbnail keeps progressing.
+        # The mix stays lossless until warmth has been applied. The mixer takes
+        # over track_arrays and clears each entry once it is copied into the mix.
+        await self.mixer.create_mix_async(
+            track_paths, paths.raw_mix, tracks=track_arrays, output_format="wav"
+        )
+
+        if on_progress:
+            on_progress("warmth", "Applying analog warmth processing")
+
+        # Phase 5: Warm the whole mix, so reverb tails and compression carry
+        # across track boundaries, then encode it once. The video's audio track
+        # is encoded from the same decode, so composition can stream-copy it.
+        await asyncio.to_thread(self.warmth.process, paths.raw_mix)
+        await asyncio.to_thread(
+            self.mixer.export,
+            paths.raw_mix,
+            paths.audio,
+            companion=(paths.video_audio, self.composer.audio_args),
+        )
+
+        # Get total duration; ffprobe blocks, so it runs in a thread too
+        total_duration = await asyncio.to_thread(self.mixer.get_duration, paths.audio)
+
+        return tracks, total_duration
+
+    async def _drain_progress(self, queue: asyncio.Queue, on_progress: callable) -> None:
+        """Deliver queued progress events in order until a None sentinel.
+
+        Each callback runs in a worker thread, so slow consumers (network
+        pushes, database writes) never stall the event loop.
+
+        Args:
+            queue: (phase, message) events, ended by None
+            on_progress: Progress callback
+        """
+        while (event := await queue.get()) is not None:
+            try:
+                await asyncio.to_thread(on_progress, *event)
+            except Exception as e:
+                logger.warning(f"Progress callback failed: {e}")
+
     async def generate(
         self,
         mood: str,
@@ -67,6 +259,10 @@ class MixPipeline:
     ) -> MixOutput:
         """Generate a complete mix.
 
+        Progress events are queued and delivered by a background task, so
+        pipeline stages never wait on the callback. All events are
+        delivered before this returns.
+
         Args:
             mood: Mood word for overlay (e.g., "FOCUS", "AMBITION")
             genre: Genre preset key
@@ -79,147 +275,180 @@ class MixPipeline:
         Raises:
             PipelineError: If generation fails
         """
-        # Validate inputs
-        if genre not in GENRE_PRESETS:
-            available = ", ".join(GENRE_PRESETS.keys())
-            raise PipelineError(f"Unknown genre '{genre}'. Available: {available}")
-
-        preset = GENRE_PRESETS[genre]
-        mood = mood.upper()
-
-        # Create output directory with timestamp for uniqueness
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_name = f"{mood.lower()}_{genre}_{timestamp}"
-        run_dir = self.output_dir / output_name
-        run_dir.mkdir(parents=True, exist_ok=True)
-
-        temp_tracks_dir = self.temp_dir / output_name / "tracks"
-        temp_tracks_dir.mkdir(parents=True, exist_ok=True)
-
-        logger.info(f"Starting pipeline: mood={mood}, genre={genre}, tracks={track_count}")
-
-        if on_progress:
-            on_progress("init", f"Generating {track_count} {preset['name']} tracks")
-
-        # Phase 1: Prepare track requests with unique AI-generated titles
-        titles = self.title_gen.generate(
-            genre_name=preset["name"],
-            style=preset["style"],
-            count=track_count
-        )
-        track_requests = [
-            TrackRequest(
-                prompt=preset["prompt"],
-                style=preset["style"],
-                title=titles[i],
-                negative_tags=preset["negative_tags"],
+        if not on_progress:
+            return await self._generate(mood, genre, track_count)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        drain = asyncio.create_task(self._drain_progress(queue, on_progress))
+        try:
+            return await self._generate(
+                mood, genre, track_count, lambda *event: queue.put_nowait(event)
             )
-            for i in range(track_count)
-        ]
-
-        # Phase 2: Parallel generation (tracks + thumbnail)
-        async with self.suno:
-            if on_progress:
-                on_progress("generate", "Generating tracks and thumbnail in parallel")
+        finally:
+            queue.put_nowait(None)
+            await drain
 
-            # Define status callback for tracks
-            def track_status(task_id, title, status):
-                if on_progress:
-                    on_progress("track_status", f"{title}: {status}")
+    async def _generate(
+        self,
+        mood: str,
+        genre: str,
+        track_count: int,
+        on_progress: Optional[callable] = None,
+    ) -> MixOutput:
+        """Run the pipeline phases for generate().
 
-            # Run track generation and thumbnail generation in parallel
-            tracks_task = self.suno.generate_tracks_parallel(
-                track_requests, on_status=track_status
-            )
+        Args:
+            mood: Mood word for overlay
+            genre: Genre preset key
+            track_count: Number of tracks to generate
+            on_progress: Optional non-blocking progress callback
 
-            thumbnail_path = run_dir / f"{output_name}_thumb.png"
-            thumbnail_task = self.thumbnail_gen.generate(thumbnail_path)
+        Returns:
+            MixOutput with paths to generated files
 
-            tracks, thumbnail_path = await asyncio.gather(tracks_task, thumbnail_task)
+        Raises:
+            PipelineError: If generation fails
+        """
+        # Validate inputs
+        try:
+            preset = get_preset(genre)
+        except KeyError as e:
+            raise PipelineError(e.args[0]) from None
 
-        if on_progress:
-            on_progress("download", f"Downloading {len(tracks)} tracks")
+        mood = mood.upper()
 
-        # Phase 3: Download tracks
-        track_urls = [t.audio_url for t in tracks]
-        track_filenames = [f"{i + 1:02d}_{t.title.replace(' ', '_')}.mp3" for i, t in enumerate(tracks)]
+        # Create output directory with timestamp for uniqueness. One UTC
+        # instant names the run and stamps its metadata.
+        now = datetime.now(timezone.utc)
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        paths = RunPaths.build(self.output_dir, self.temp_dir, mood, genre, timestamp)
+        paths.run_dir.mkdir(parents=True, exist_ok=True)
+        paths.tracks_dir.mkdir(parents=True, exist_ok=True)
 
-        downloaded_paths = await download_tracks(
-            track_urls,
-            temp_tracks_dir,
-            filenames=track_filenames,
-        )
+        logger.info(f"Starting pipeline: mood={mood}, genre={genre}, tracks={track_count}")
 
         if on_progress:
-            on_progress("mix", "Mixing audio tracks")
-
-        # Phase 4: Mix audio
-        audio_path = run_dir / f"{output_name}.mp3"
-        self.mixer.create_mix(downloaded_paths, audio_path)
-
+            on_progress("init", f"Generating {track_count} {preset.name} tracks")
+
+        # Phase 1: Unique AI-generated titles. The YouTube title and thumbnail
+        # prompt come from the same call, using the expected mix length.
+        expected_hours = max(1, int(track_count * ESTIMATED_TRACK_SECONDS // 3600))
+        uses_assets = self.thumbnail_gen.uses_assets
+
+        async def build_requests() -> list[TrackRequest]:
+            copy = await copy_task
+            return [
+                TrackRequest(
+                    prompt=preset.prompt,
+                    style=preset.style,
+                    title=title,
+                    negative_tags=preset.negative_tags,
+                )
+                for title in copy.track_titles
+            ]
+
+        async def make_thumbnail() -> Path:
+            # Asset thumbnails need no prompt, so they don't wait for Phase 1
+            prompt = None if uses_assets else (await copy_task).thumbnail_prompt or None
+            return await self.thumbnail_gen.generate(paths.thumbnail, prompt=prompt)
+
+        # Phases 2-4: the thumbnail shares nothing with the audio chain until
+        # composition, so it runs alongside generation, download and mixing
         if on_progress:
-            on_progress("warmth", "Applying analog warmth processing")
-
-        # Phase 4.5: Apply warmth processing
-        self.warmth.process(audio_path)
-
-        # Get total duration
-        total_duration = self.mixer.get_duration(audio_path)
+            on_progress("generate", "Generating tracks and thumbnail in parallel")
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                copy_task = group.create_task(
+                    asyncio.to_thread(
+                        self.title_gen.generate_copy,
+                        genre_name=preset.name,
+                        style=preset.style,
+                        mood=mood,
+                        count=track_count,
+                        duration_hours=expected_hours,
+                        thumbnail_prompt=not uses_assets,
+                    )
+                )
+                requests_task = group.create_task(build_requests())
+                audio_task = group.create_task(
+                    self._produce_audio(requests_task, paths, on_progress)
+                )
+                thumbnail_task = group.create_task(make_thumbnail())
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from None
+
+        copy = copy_task.result()
+        tracks, total_duration = audio_task.result()
+        thumbnail_path = thumbnail_task.result()
 
         if on_progress:
             on_progress("compose", "Composing video")
 
-        # Phase 5: Compose video
-        video_path = run_dir / f"{output_name}.mp4"
-        video_path, yt_thumbnail_path = self.composer.compose(
+        # Phases 5-6: the video encode and the AI YouTube title are independent,
+        # so the title request runs while the video composes. The Phase 1 title
+        # is reused when the mix came out at the expected length.
+        duration_hours = max(1, int(total_duration // 3600))
+
+        compose = asyncio.to_thread(
+            self.composer.compose,
             thumbnail_path=thumbnail_path,
-            audio_path=audio_path,
+            audio_path=paths.video_audio,
             overlay_text=mood,
-            output_path=video_path,
+            output_path=paths.video,
+            copy_audio=True,
         )
 
+        if copy.youtube_title and duration_hours == expected_hours:
+            video_path, yt_thumbnail_path = await compose
+            youtube_title = copy.youtube_title
+        else:
+            (video_path, yt_thumbnail_path), youtube_title = await asyncio.gather(
+                compose,
+                asyncio.to_thread(
+                    self.yt_title_gen.generate,
+                    genre_name=preset.name,
+                    mood=mood,
+                    duration_hours=duration_hours,
+                ),
+            )
+
         # Phase 6: Generate YouTube metadata
         track_list = [{"title": t.title, "duration": t.duration} for t in tracks]
         duration_formatted = format_duration(total_duration)
-        duration_hours = max(1, int(total_duration // 3600))
-
-        # Generate AI-powered YouTube title
-        youtube_title = self.yt_title_gen.generate(
-            genre_name=preset["name"],
-            mood=mood,
-            duration_hours=duration_hours,
-        )
 
         metadata = MixMetadata(
             title=youtube_title,
             description=generate_youtube_description(
                 mood=mood,
-                genre_name=preset["name"],
+                genre_name=preset.name,
                 duration_formatted=duration_formatted,
                 tracks=track_list,
             ),
-            tags=generate_tags(mood, preset["name"]),
-            hashtags=generate_hashtags(mood, preset["name"]),
+            tags=generate_tags(mood, preset.name),
+            hashtags=generate_hashtags(mood, preset.name),
             mood=mood,
             genre=genre,
-            genre_name=preset["name"],
-            bpm=preset["bpm"],
+            genre_name=preset.name,
+            bpm=preset.bpm,
             track_count=len(tracks),
             total_duration_seconds=total_duration,
             tracks=track_list,
-            generated_at=datetime.utcnow().isoformat(),
+            generated_at=now.isoformat(),
         )
 
-        metadata_path = run_dir / f"{output_name}.json"
-        metadata_path.write_text(json.dumps(metadata.model_dump(), indent=2))
+        # pydantic-core serializes straight to JSON bytes without a dict pass
+        async with aiofiles.open(paths.metadata, "wb") as f:
+            await f.write(metadata.model_dump_json(indent=2).encode())
 
-        # Cleanup temp files if configured
+        # Cleanup temp files in the background; close() waits for it
         if self.config.pipeline.cleanup_temp:
-            import shutil
-            temp_run_dir = self.temp_dir / output_name
-            if temp_run_dir.exists():
-                shutil.rmtree(temp_run_dir)
-                logger.debug(f"Cleaned up temp directory: {temp_run_dir}")
+            cleanup = asyncio.create_task(
+                asyncio.to_thread(shutil.rmtree, paths.temp_dir, ignore_errors=True)
+            )
+            self._pending_cleanups.add(cleanup)
+            cleanup.add_done_callback(self._pending_cleanups.discard)
+            logger.debug(f"Scheduled cleanup of temp directory: {paths.temp_dir}")
 
         if on_progress:
             on_progress("complete", "Pipeline complete")
@@ -229,10 +458,11 @@ class MixPipeline:
         return MixOutput(
             video_path=video_path,
             thumbnail_path=yt_thumbnail_path,  # YouTube thumbnail with text overlay
-            audio_path=audio_path,
-            metadata_path=metadata_path,
+            audio_path=paths.audio,
+            metadata_path=paths.metadata,
             mood=mood,
             genre=genre,
             track_count=len(tracks),
             total_duration=total_duration,
+            generated_at=now,
         )
@@ -1,11 +1,18 @@
 """Genre presets and title generation for Suno Mixer."""
 
+import functools
 import random
-from typing import TypedDict
+import string
+import warnings
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional
 
 
-class GenrePreset(TypedDict):
-    """Type definition for genre preset."""
+@dataclass(frozen=True, slots=True)
+class GenrePreset:
+    """Suno generation settings for one genre."""
 
     name: str
     style: str
@@ -14,86 +21,87 @@ class GenrePreset(TypedDict):
     negative_tags: str
 
 
-GENRE_PRESETS: dict[str, GenrePreset] = {
-    "synthwave": {
-        "name": "Synthwave",
-        "style": "80s synthwave, dreamy retrowave, nostalgic outrun, emotional synthwave",
-        "prompt": """Dreamy 80s synthwave with nostalgic emotional vibes.
+# Read-only so callers can't mutate the shared presets
+GENRE_PRESETS: Mapping[str, GenrePreset] = MappingProxyType({
+    "synthwave": GenrePreset(
+        name="Synthwave",
+        style="80s synthwave, dreamy retrowave, nostalgic outrun, emotional synthwave",
+        prompt="""Dreamy 80s synthwave with nostalgic emotional vibes.
 Lush analog synthesizers, warm pads, shimmering arpeggios, gentle pulsing bass.
 Nostalgic sunset drives and neon-lit nights. Emotional and cinematic.
 Influenced by The Midnight, FM-84, Timecop1983, and Gunship's softer moments.
 Gated reverb drums, chorus-drenched leads, ethereal synth melodies.
 Warm tape saturation, subtle sidechain pump, VHS aesthetic.
 Bittersweet and hopeful. Perfect background for focused creative work. 92 BPM.""",
-        "bpm": 92,
-        "negative_tags": "vocals, singing, saxophone, sax, harsh, industrial, aggressive, heavy, distorted, busy, chaotic",
-    },
-    "deep_house": {
-        "name": "Chill Deep House",
-        "style": "Chill deep house, smooth electronic, laid-back grooves",
-        "prompt": """Smooth chill deep house perfect for focused work sessions.
+        bpm=92,
+        negative_tags="vocals, singing, saxophone, sax, harsh, industrial, aggressive, heavy, distorted, busy, chaotic",
+    ),
+    "deep_house": GenrePreset(
+        name="Chill Deep House",
+        style="Chill deep house, smooth electronic, laid-back grooves",
+        prompt="""Smooth chill deep house perfect for focused work sessions.
 Warm rolling basslines, soft Rhodes chords, gentle shuffling percussion.
 Mellow filtered pads, subtle grooves, relaxed atmosphere.
 Coffee shop meets late-night lounge. Unobtrusive yet engaging. 110 BPM.""",
-        "bpm": 110,
-        "negative_tags": "vocals, drops, aggressive, intense, buildup, mainstream edm, harsh",
-    },
-    "ambient_electronic": {
-        "name": "Ambient Focus",
-        "style": "Ambient electronic, peaceful soundscape, atmospheric focus music",
-        "prompt": """Peaceful ambient electronic soundscape for deep concentration.
+        bpm=110,
+        negative_tags="vocals, drops, aggressive, intense, buildup, mainstream edm, harsh",
+    ),
+    "ambient_electronic": GenrePreset(
+        name="Ambient Focus",
+        style="Ambient electronic, peaceful soundscape, atmospheric focus music",
+        prompt="""Peaceful ambient electronic soundscape for deep concentration.
 Slowly evolving pads, gentle textures, spacious atmospheres.
 Soft drones, subtle melodic fragments, calming washes of sound.
 Like floating through clouds. Meditative and serene. Perfect for deep work. 70 BPM.""",
-        "bpm": 70,
-        "negative_tags": "vocals, drums, percussion, harsh, intense, fast, aggressive",
-    },
-    "lofi_beats": {
-        "name": "Lo-Fi Chill",
-        "style": "Lo-fi hip hop, chill beats, jazzy lo-fi, study music",
-        "prompt": """Warm lo-fi hip hop beats perfect for studying and coding.
+        bpm=70,
+        negative_tags="vocals, drums, percussion, harsh, intense, fast, aggressive",
+    ),
+    "lofi_beats": GenrePreset(
+        name="Lo-Fi Chill",
+        style="Lo-fi hip hop, chill beats, jazzy lo-fi, study music",
+        prompt="""Warm lo-fi hip hop beats perfect for studying and coding.
 Mellow jazzy samples, soft dusty drums, gentle vinyl crackle.
 Smooth Rhodes chords, laid-back grooves, cozy late-night vibes.
 Like a rainy afternoon with coffee. Nostalgic and comforting. 85 BPM.""",
-        "bpm": 85,
-        "negative_tags": "vocals, singing, intense, fast, aggressive, harsh, loud",
-    },
-    "minimal_techno": {
-        "name": "Minimal Electronic",
-        "style": "Minimal electronic, downtempo, hypnotic grooves, subtle techno",
-        "prompt": """Minimal electronic with hypnotic subtle grooves for focused work.
+        bpm=85,
+        negative_tags="vocals, singing, intense, fast, aggressive, harsh, loud",
+    ),
+    "minimal_techno": GenrePreset(
+        name="Minimal Electronic",
+        style="Minimal electronic, downtempo, hypnotic grooves, subtle techno",
+        prompt="""Minimal electronic with hypnotic subtle grooves for focused work.
 Soft clicks and gentle percussion, warm filtered basslines.
 Slowly evolving patterns, understated melodies, spacious mix.
 Repetitive but not intrusive. Background texture for concentration. 100 BPM.""",
-        "bpm": 100,
-        "negative_tags": "vocals, aggressive, pounding, harsh, loud, intense, drops",
-    },
-    "neo_classical": {
-        "name": "Neo Classical",
-        "style": "Neo classical, modern classical, cinematic piano, orchestral ambient",
-        "prompt": """Gentle neo-classical music blending piano with soft electronic textures.
+        bpm=100,
+        negative_tags="vocals, aggressive, pounding, harsh, loud, intense, drops",
+    ),
+    "neo_classical": GenrePreset(
+        name="Neo Classical",
+        style="Neo classical, modern classical, cinematic piano, orchestral ambient",
+        prompt="""Gentle neo-classical music blending piano with soft electronic textures.
 Delicate piano melodies, subtle string arrangements, ambient pads.
 Emotional and introspective modern classical with minimalist sensibility.
 Warm and contemplative. Beautiful background for creative work. 75 BPM.""",
-        "bpm": 75,
-        "negative_tags": "vocals, drums, harsh, loud, fast, aggressive, intense",
-    },
-    "glitch_chill": {
-        "name": "Dark Glitch",
-        "style": "Dark Boards of Canada, melancholic analog electronic, somber IDM, haunting ambient electronica",
-        "prompt": """Dark melancholic electronica with cold analog textures and deep emotional weight.
+        bpm=75,
+        negative_tags="vocals, drums, harsh, loud, fast, aggressive, intense",
+    ),
+    "glitch_chill": GenrePreset(
+        name="Dark Glitch",
+        style="Dark Boards of Canada, melancholic analog electronic, somber IDM, haunting ambient electronica",
+        prompt="""Dark melancholic electronica with cold analog textures and deep emotional weight.
 Sorrowful floating synthesizers with tape degradation and fading memories.
 Lonely melodic fragments drifting through minor key pads and hollow washes.
 Subtle glitch textures, broken and hypnotic, slowly decaying like old photographs.
 Tape wobble, dusty vinyl crackle, lo-fi sadness and loss.
 Somber chord progressions, mournful arpeggios, introspective and heavy-hearted. Dark, sad, deeply melancholic. 72 BPM.""",
-        "bpm": 72,
-        "negative_tags": "vocals, singing, harsh, industrial, aggressive, heavy, distorted, intense, pounding, loud, upbeat, happy, bright",
-    },
-    "dark_electronic": {
-        "name": "Dark Electronic Focus",
-        "style": "Dark atmospheric electronic, moody downtempo, cinematic chill, late-night coding music",
-        "prompt": """Dark atmospheric electronic music perfect for late-night coding sessions.
+        bpm=72,
+        negative_tags="vocals, singing, harsh, industrial, aggressive, heavy, distorted, intense, pounding, loud, upbeat, happy, bright",
+    ),
+    "dark_electronic": GenrePreset(
+        name="Dark Electronic Focus",
+        style="Dark atmospheric electronic, moody downtempo, cinematic chill, late-night coding music",
+        prompt="""Dark atmospheric electronic music perfect for late-night coding sessions.
 Moody downtempo beats with deep sub-bass and crisp minimal percussion.
 Spacious reverb-drenched synths, dark ambient pads, subtle melodic motifs.
 Cinematic tension without resolution, like a noir film soundtrack.
@@ -101,13 +109,13 @@ Influenced by Tycho, Kiasmos, Moderat, and Carbon Based Lifeforms.
 Clean production with warm analog character and digital precision.
 Hypnotic and immersive, creating a focused tunnel of concentration.
 Dark but not oppressive, atmospheric but not distracting. 95 BPM.""",
-        "bpm": 95,
-        "negative_tags": "vocals, singing, drops, buildup, harsh, aggressive, loud, upbeat, happy, bright, EDM, dubstep, trap",
-    },
-    "zen_electronic": {
-        "name": "Zen Electronic",
-        "style": "Peaceful ambient electronic, zen downtempo, meditative chill, calm study music",
-        "prompt": """Peaceful zen electronic music for calm focused study sessions.
+        bpm=95,
+        negative_tags="vocals, singing, drops, buildup, harsh, aggressive, loud, upbeat, happy, bright, EDM, dubstep, trap",
+    ),
+    "zen_electronic": GenrePreset(
+        name="Zen Electronic",
+        style="Peaceful ambient electronic, zen downtempo, meditative chill, calm study music",
+        prompt="""Peaceful zen electronic music for calm focused study sessions.
 Gentle floating pads, soft evolving textures, warm embracing atmospheres.
 Delicate melodic phrases that drift like clouds, unhurried and serene.
 Subtle organic percussion, soft clicks and whispers of rhythm.
@@ -116,13 +124,13 @@ Warm analog synthesis with airy digital shimmer and natural field recordings.
 Like morning light through window blinds, gentle rain on leaves.
 Meditative and grounding, creating a peaceful sanctuary for deep work.
 Calm without being sleepy, present without demanding attention. 72 BPM.""",
-        "bpm": 72,
-        "negative_tags": "vocals, singing, drops, buildup, harsh, aggressive, loud, fast, intense, dark, heavy, bass drops, EDM, dubstep, trap",
-    },
-    "chillstep": {
-        "name": "Chillstep",
-        "style": "Chillstep, melodic dubstep, atmospheric bass, emotional electronic, calm study music",
-        "prompt": """Calm melodic chillstep perfect for focused study sessions.
+        bpm=72,
+        negative_tags="vocals, singing, drops, buildup, harsh, aggressive, loud, fast, intense, dark, heavy, bass drops, EDM, dubstep, trap",
+    ),
+    "chillstep": GenrePreset(
+        name="Chillstep",
+        style="Chillstep, melodic dubstep, atmospheric bass, emotional electronic, calm study music",
+        prompt="""Calm melodic chillstep perfect for focused study sessions.
 Soft sub-bass swells, gentle wobbles, lush ethereal pads washing over everything.
 Emotional piano melodies layered with shimmering synths and airy textures.
 Slow halftime drums with soft snares and delicate hi-hats, never overpowering.
@@ -131,13 +139,13 @@ Dreamy reverb-soaked atmospheres, warm analog warmth meets digital clarity.
 Like stargazing on a quiet night, peaceful and introspective.
 Melodic and emotional without being intense, perfect background for deep focus.
 Calming bass presence that grounds without distracting. 140 BPM halftime feel.""",
-        "bpm": 140,
-        "negative_tags": "vocals, singing, heavy drops, aggressive, loud, intense, harsh, brostep, riddim, heavy bass, screaming synths",
-    },
-    "winter_focus": {
-        "name": "Winter Focus",
-        "style": "Dark minimal electronic, calm chill electronica, winter ambient, deep focus coding music",
-        "prompt": """Calm, steady dark electronica perfect for deep focus and late-night coding.
+        bpm=140,
+        negative_tags="vocals, singing, heavy drops, aggressive, loud, intense, harsh, brostep, riddim, heavy bass, screaming synths",
+    ),
+    "winter_focus": GenrePreset(
+        name="Winter Focus",
+        style="Dark minimal electronic, calm chill electronica, winter ambient, deep focus coding music",
+        prompt="""Calm, steady dark electronica perfect for deep focus and late-night coding.
 Slow tempo with gentle low-end pulse providing sustained concentration foundation.
 Crisp minimal hi-hats and soft percussion, never intrusive or busy.
 Cold, spacious atmospheres with winter night clarity and stillness.
@@ -147,13 +155,13 @@ Influenced by Burial, Boards of Canada, and Tycho's darker moments.
 Seamless instrumental flow, hypnotic and meditative without being sleepy.
 Like coding alone at 3am with snow falling outside, focused and calm.
 Dark but not oppressive, minimal but not empty. 68 BPM.""",
-        "bpm": 68,
-        "negative_tags": "vocals, singing, drops, buildup, harsh, aggressive, loud, fast, intense, upbeat, happy, bright, EDM, dubstep, trap, busy drums, complex rhythms",
-    },
-    "true_devotion": {
-        "name": "True Devotion",
-        "style": "Future garage, chillstep, downtempo house, ambient bass, minimal electronic, deep focus work music",
-        "prompt": """Minimal future garage and chillstep built for true devotion to the craft.
+        bpm=68,
+        negative_tags="vocals, singing, drops, buildup, harsh, aggressive, loud, fast, intense, upbeat, happy, bright, EDM, dubstep, trap, busy drums, complex rhythms",
+    ),
+    "true_devotion": GenrePreset(
+        name="True Devotion",
+        style="Future garage, chillstep, downtempo house, ambient bass, minimal electronic, deep focus work music",
+        prompt="""Minimal future garage and chillstep built for true devotion to the craft.
 Deep sub-bass providing clear momentum and grounded foundation.
 Calm intensity with future rhythm patterns, never rushed but always moving forward.
 Sparse melodic fragments floating over warm low-end, clean and intentional.
@@ -164,10 +172,13 @@ Like locking in for serious work, one step further than yesterday.
 Ambient house warmth meets future garage precision.
 Consistent progress without distraction, calm without being sleepy.
 Perfect for long coding sessions, deep design work, and focused productivity. 128 BPM.""",
-        "bpm": 128,
-        "negative_tags": "vocals, singing, drops, buildup, harsh, aggressive, loud, intense, happy, bright, EDM, dubstep, trap, busy, chaotic, overwhelming",
-    },
-}
+        bpm=128,
+        negative_tags="vocals, singing, drops, buildup, harsh, aggressive, loud, intense, happy, bright, EDM, dubstep, trap, busy, chaotic, overwhelming",
+    ),
+})
+
+# Listed in unknown-genre errors
+AVAILABLE_GENRES = ", ".join(GENRE_PRESETS)
 
 
 # Title word combinations for each genre (3-4 words per title)
@@ -608,8 +619,16 @@ TITLE_WORDS: dict[str, list[list[str]]] = {
     ],
 }
 
+# TITLE_WORDS frozen into tuples once, so title generation skips the
+# per-call fallback lookup and indexes immutable columns
+_TITLE_WORDS_TUPLES: dict[str, tuple[tuple[str, ...], ...]] = {
+    genre: tuple(tuple(column) for column in columns)
+    for genre, columns in TITLE_WORDS.items()
+}
+_DEFAULT_WORDS = _TITLE_WORDS_TUPLES["synthwave"]
+
 
-MOOD_WORDS = [
+MOOD_WORDS = (
     "HYPERSCALE",
     "MAINFRAME",
     "BINARY",
@@ -629,7 +648,7 @@ MOOD_WORDS = [
     "DEVOTION",
     "FURTHER",
     "LOCKED",
-]
+)
 
 
 # System prompt for generating unique track titles
@@ -712,8 +731,82 @@ Style requirements:
 Output ONLY the image prompt. Be specific and vivid. Emphasize soft lighting and muted colors."""
 
 
-def generate_title(genre: str, index: int) -> str:
-    """Generate a track title for a genre (deprecated, use generate_titles for uniqueness).
+# System prompt for generating all of a mix's text in one structured call.
+# Static instructions come first and per-mix values last, so every run shares
+# the same prompt prefix for Gemini's implicit caching. The prompt is far below
+# the minimum size for explicit context caches.
+MIX_COPY_SYSTEM_PROMPT = """You are the creative director for a coding/focus music YouTube channel,
+writing the text for a dark, electronic focus music mix for software engineers,
+programmers and developers.
+
+Aesthetic inspiration: Tron Legacy, Blade Runner, cyberpunk, dystopian futures,
+neon-noir, late-night coding sessions, dark warehouses, digital grids.
+
+Return a JSON object with these fields:
+
+track_titles: unique, evocative track titles. Each title should:
+- Be 2-4 words long
+- Feel dark, moody, and electronic
+- Evoke digital/technological imagery (grids, circuits, signals, voids)
+- Be poetic and memorable, not generic
+- Avoid happy, warm, or bright imagery
+
+youtube_title: a single YouTube title for the mix that:
+- Includes keywords like "coding", "programming", "focus", or "deep work"
+- Is click-worthy but not clickbait
+- Is at most 70 characters
+- Feels fresh and unique, not templated
+
+thumbnail_prompt: {thumbnail_instructions}
+
+Mix details:
+Genre: {genre_name}
+Style: {style}
+Mood: {mood}
+Duration: {duration_hours} hours
+Number of track titles: {count}"""
+
+# thumbnail_prompt instructions for MIX_COPY_SYSTEM_PROMPT
+MIX_COPY_THUMBNAIL_INSTRUCTIONS = """a detailed image prompt for a landscape (16:9)
+YouTube thumbnail: a dark, moody scene with soft diffuse lighting, such as a silhouette
+at monitors during blue hour or a minimalist workspace at golden hour. Muted, desaturated
+colors, cinematic contrast, film grain, photorealistic. No faces, text or watermarks."""
+
+
+def _compile_prompt(template: str) -> Callable[..., str]:
+    """Split a prompt template once into literal text and field names.
+
+    Args:
+        template: str.format-style template with named fields
+
+    Returns:
+        Function taking the fields as keyword arguments and returning the
+        rendered prompt, without re-scanning the template for braces
+    """
+    pieces = tuple(
+        (literal, field) for literal, field, _, _ in string.Formatter().parse(template)
+    )
+
+    def render(**fields) -> str:
+        return "".join(
+            literal if field is None else f"{literal}{fields[field]}"
+            for literal, field in pieces
+        )
+
+    return render
+
+
+# Precompiled renderers for the prompt templates above
+render_title_prompt = _compile_prompt(TITLE_SYSTEM_PROMPT)
+render_youtube_title_prompt = _compile_prompt(YOUTUBE_TITLE_SYSTEM_PROMPT)
+render_mix_copy_prompt = _compile_prompt(MIX_COPY_SYSTEM_PROMPT)
+
+
+def _generate_title(genre: str, index: int) -> str:
+    """Generate a track title for a genre.
+
+    Deprecated and reachable only as presets.generate_title, which warns;
+    use generate_titles for unique titles.
 
     Args:
         genre: The genre key from GENRE_PRESETS
@@ -722,41 +815,47 @@ def generate_title(genre: str, index: int) -> str:
     Returns:
         A three-word evocative title
     """
-    words = TITLE_WORDS.get(genre, TITLE_WORDS["synthwave"])
+    first, second, third = _TITLE_WORDS_TUPLES.get(genre, _DEFAULT_WORDS)
+
+    # Local generator, so the global random state is left untouched
+    rng = random.Random(index * 31 + hash(genre) % 1000)
+
+    return f"{rng.choice(first)} {rng.choice(second)} {rng.choice(third)}"
+
+
+def _sample_titles(rng: random.Random, genre: str, count: int) -> list[str]:
+    """Draw up to count unique titles for a genre by sampling distinct word combinations."""
+    first, second, third = _TITLE_WORDS_TUPLES.get(genre, _DEFAULT_WORDS)
+    n_second, n_third = len(second), len(third)
+    combinations = len(first) * n_second * n_third
 
-    random.seed(index * 31 + hash(genre) % 1000)
-    first = random.choice(words[0])
-    second = random.choice(words[1])
-    third = random.choice(words[2])
-    random.seed()  # Reset to true randomness
+    indices = rng.sample(range(combinations), min(count, combinations))
+    return [
+        f"{first[i // (n_second * n_third)]} {second[(i // n_third) % n_second]} {third[i % n_third]}"
+        for i in indices
+    ]
 
-    return f"{first} {second} {third}"
 
+@functools.lru_cache(maxsize=256)
+def _seeded_titles(genre: str, count: int, seed: int) -> tuple[str, ...]:
+    """Deterministic titles for a seed, cached since the result never changes."""
+    return tuple(_sample_titles(random.Random(seed), genre, count))
 
-def generate_titles(genre: str, count: int) -> list[str]:
+
+def generate_titles(genre: str, count: int, seed: Optional[int] = None) -> list[str]:
     """Generate unique track titles for a genre.
 
     Args:
         genre: The genre key from GENRE_PRESETS
         count: Number of unique titles to generate
+        seed: Optional seed for reproducible titles; seeded results are cached
 
     Returns:
         List of unique three-word evocative titles
     """
-    words = TITLE_WORDS.get(genre, TITLE_WORDS["synthwave"])
-    titles: set[str] = set()
-    max_attempts = count * 10  # Prevent infinite loop
-    attempts = 0
-
-    while len(titles) < count and attempts < max_attempts:
-        first = random.choice(words[0])
-        second = random.choice(words[1])
-        third = random.choice(words[2])
-        title = f"{first} {second} {third}"
-        titles.add(title)
-        attempts += 1
-
-    return list(titles)[:count]
+    if seed is not None:
+        return list(_seeded_titles(genre, count, seed))
+    return _sample_titles(random.Random(), genre, count)
 
 
 def get_preset(genre: str) -> GenrePreset:
@@ -771,9 +870,19 @@ def get_preset(genre: str) -> GenrePreset:
     Raises:
         KeyError: If genre not found
     """
-    if genre not in GENRE_PRESETS:
-        available = ", ".join(GENRE_PRESETS.keys())
-        raise KeyError(f"Unknown genre '{genre}'. Available: {available}")
-    return GENRE_PRESETS[genre]
-
-
+    try:
+        return GENRE_PRESETS[genre]
+    except KeyError:
+        raise KeyError(f"Unknown genre '{genre}'. Available: {AVAILABLE_GENRES}") from None
+
+
+def __getattr__(name):
+    """Resolve deprecated names, warning on access."""
+    if name == "generate_title":
+        warnings.warn(
+            "generate_title is deprecated, use generate_titles for unique titles",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return _generate_title
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -16,6 +16,13 @@ from suno_mixer.models import (
 
 logger = logging.getLogger(__name__)
 
+# Idle pooled connections outlive the gap between status polls, so each
+# poll reuses a warm connection instead of repeating the TCP/TLS handshake
+KEEPALIVE_SECONDS = 75
+
+# Growth factor for the delay between status polls
+POLL_BACKOFF = 1.25
+
 
 class SunoAPIError(Exception):
     """Suno API error."""
@@ -26,7 +33,11 @@ class SunoAPIError(Exception):
 
 
 class SunoClient:
-    """Async client for Suno API with parallel track generation."""
+    """Async client for Suno API with parallel track generation.
+
+    Each client owns one connection pool, so reuse a single client for
+    everything that talks to Suno rather than creating one per caller.
+    """
 
     def __init__(self, config: SunoConfig):
         """Initialize Suno client.
@@ -38,6 +49,7 @@ class SunoClient:
         self.base_url = config.base_url
         self.api_key = config.api_key
         self._session: Optional[aiohttp.ClientSession] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
 
     @property
     def headers(self) -> dict[str, str]:
@@ -48,15 +60,48 @@ class SunoClient:
         }
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create aiohttp session."""
+        """Get or create aiohttp session.
+
+        The connector pool is sized from max_concurrent and keeps idle
+        connections alive across polls; the session owns it, so close()
+        releases both.
+        """
+        # No lock needed: nothing awaits between this check and the
+        # assignment, so concurrent callers on the loop can't both create one
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(headers=self.headers)
+            connector = aiohttp.TCPConnector(
+                limit=self.config.max_concurrent * 4,
+                limit_per_host=self.config.max_concurrent * 2,
+                keepalive_timeout=KEEPALIVE_SECONDS,
+                # Every request goes to one host, so resolve it rarely and
+                # fall back to the other address family sooner if one stalls
+                ttl_dns_cache=600,
+                happy_eyeballs_delay=0.1,
+                enable_cleanup_closed=True,
+            )
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=30)
+            self._session = aiohttp.ClientSession(
+                headers=self.headers, connector=connector, timeout=timeout
+            )
         return self._session
 
+    @property
+    def semaphore(self) -> asyncio.Semaphore:
+        """Shared limiter for concurrent track generations.
+
+        Created once per client session, so overlapping batches share the
+        max_concurrent budget instead of each getting their own.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.config.max_concurrent)
+        return self._semaphore
+
     async def close(self) -> None:
         """Close the client session."""
         if self._session and not self._session.closed:
             await self._session.close()
+        # Semaphores bind to an event loop, so start fresh with the next session
+        self._semaphore = None
 
     async def __aenter__(self) -> "SunoClient":
         """Async context manager entry."""
@@ -96,8 +141,7 @@ class SunoClient:
         logger.debug(f"Generating track: {request.title}")
 
         async with session.post(f"{self.base_url}/generate", json=payload) as resp:
-            data = await resp.json()
-            response = GenerateResponse(**data)
+            response = GenerateResponse.model_validate_json(await resp.read())
 
             if not response.is_success:
                 raise SunoAPIError(
@@ -128,8 +172,9 @@ class SunoClient:
         async with session.get(
             f"{self.base_url}/generate/record-info", params={"taskId": task_id}
         ) as resp:
-            data = await resp.json()
-            return TaskStatusResponse(**data)
+            # Validate the raw body directly so pydantic-core parses the JSON
+            # and builds the model in one pass
+            return TaskStatusResponse.model_validate_json(await resp.read())
 
     async def wait_for_track(
         self,
@@ -139,6 +184,10 @@ class SunoClient:
     ) -> TrackResult:
         """Wait for a track generation to complete.
 
+        Polls start at poll_interval_seconds and back off by POLL_BACKOFF up
+        to max_poll_interval_seconds, so quick tracks are noticed early
+        without polling long ones at a high rate.
+
         Args:
             task_id: Task ID to wait for
             title: Track title (for logging)
@@ -151,10 +200,12 @@ class SunoClient:
             SunoAPIError: If generation fails or times out
         """
         timeout = self.config.timeout_seconds
-        interval = self.config.poll_interval_seconds
-        elapsed = 0
+        delay = self.config.poll_interval_seconds
+        max_delay = self.config.max_poll_interval_seconds
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
 
-        while elapsed < timeout:
+        while (remaining := deadline - loop.time()) > 0:
             status_response = await self.get_task_status(task_id)
 
             if on_status:
@@ -183,8 +234,8 @@ class SunoClient:
                 )
 
             logger.debug(f"Track '{title}' status: {status_response.status}")
-            await asyncio.sleep(interval)
-            elapsed += interval
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * POLL_BACKOFF, max_delay)
 
         raise SunoAPIError(f"Timeout waiting for track '{title}' after {timeout}s")
 
@@ -205,6 +256,31 @@ class SunoClient:
         task_id = await self.generate_track(request)
         return await self.wait_for_track(task_id, request.title, on_status)
 
+    async def _generate_bounded(
+        self,
+        index: int,
+        request: TrackRequest,
+        on_status: Optional[callable] = None,
+    ) -> TrackResult:
+        """Generate one track of a batch under the shared semaphore.
+
+        Args:
+            index: Position of the request in its batch
+            request: Track generation request
+            on_status: Optional callback for status updates
+
+        Returns:
+            Track result with audio URL
+
+        Raises:
+            SunoAPIError: If the track fails, naming its position and title
+        """
+        async with self.semaphore:
+            try:
+                return await self.generate_track_and_wait(request, on_status)
+            except Exception as e:
+                raise SunoAPIError(f"Track {index + 1} '{request.title}' failed: {e}") from e
+
     async def generate_tracks_parallel(
         self,
         requests: list[TrackRequest],
@@ -212,6 +288,11 @@ class SunoClient:
     ) -> list[TrackResult]:
         """Generate multiple tracks in parallel.
 
+        A pool of at most max_concurrent workers pulls requests in order,
+        so only that many tasks are ever scheduled. The first failure
+        cancels the remaining generations rather than letting them poll
+        until their own timeouts.
+
         Args:
             requests: List of track generation requests
             on_status: Optional callback for status updates
@@ -224,31 +305,20 @@ class SunoClient:
         """
         logger.info(f"Starting parallel generation of {len(requests)} tracks")
 
-        # Create tasks for all track generations
-        tasks = [
-            self.generate_track_and_wait(request, on_status) for request in requests
-        ]
-
-        # Run all tasks concurrently with semaphore for rate limiting
-        semaphore = asyncio.Semaphore(self.config.max_concurrent)
-
-        async def limited_task(task):
-            async with semaphore:
-                return await task
+        track_results: list[Optional[TrackResult]] = [None] * len(requests)
+        pending = iter(enumerate(requests))
 
-        limited_tasks = [limited_task(task) for task in tasks]
+        async def worker() -> None:
+            # Workers share one iterator, so each request is taken exactly once
+            for i, request in pending:
+                track_results[i] = await self._generate_bounded(i, request, on_status)
 
-        # Wait for all to complete
-        results = await asyncio.gather(*limited_tasks, return_exceptions=True)
-
-        # Check for exceptions
-        track_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                raise SunoAPIError(
-                    f"Track {i + 1} '{requests[i].title}' failed: {result}"
-                )
-            track_results.append(result)
+        try:
+            async with asyncio.TaskGroup() as group:
+                for _ in range(min(len(requests), self.config.max_concurrent)):
+                    group.create_task(worker())
+        except ExceptionGroup as e:
+            raise e.exceptions[0] from None
 
         logger.info(f"All {len(track_results)} tracks generated successfully")
         return track_results
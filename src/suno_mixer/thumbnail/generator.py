@@ -1,15 +1,26 @@
 """Thumbnail generation using Google Gemini or pre-generated assets."""
 
+import asyncio
+import itertools
 import logging
+import os
 import random
 import shutil
+from collections import deque
 from pathlib import Path
+from typing import Optional
 
 from suno_mixer.config import ThumbnailConfig
 from suno_mixer.presets import THUMBNAIL_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
 
+# Image types picked up from the assets directory
+ASSET_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "webp"})
+
+# Recently picked assets skipped by the next selections
+RECENT_ASSETS = 8
+
 
 class ThumbnailError(Exception):
     """Thumbnail generation error."""
@@ -22,6 +33,8 @@ class ThumbnailGenerator:
     def __init__(self, config: ThumbnailConfig):
         self.config = config
         self._client = None
+        self._assets: Optional[list[Path]] = None
+        self._recent: deque[Path] = deque(maxlen=RECENT_ASSETS)
 
     @property
     def client(self):
@@ -32,23 +45,46 @@ class ThumbnailGenerator:
         return self._client
 
     def _get_asset_images(self) -> list[Path]:
-        """Get list of pre-generated thumbnail images."""
-        assets_dir = Path(self.config.assets_directory)
-        if not assets_dir.exists():
-            return []
-        extensions = ('.png', '.jpg', '.jpeg', '.webp')
-        return [f for f in assets_dir.iterdir() if f.suffix.lower() in extensions]
+        """Get list of pre-generated thumbnail images.
+
+        The directory is scanned once and cached; call invalidate_assets()
+        after adding or removing images.
+        """
+        if self._assets is None:
+            try:
+                with os.scandir(self.config.assets_directory) as entries:
+                    self._assets = [
+                        Path(entry.path)
+                        for entry in entries
+                        if os.path.splitext(entry.name)[1][1:].lower() in ASSET_EXTENSIONS
+                        and entry.is_file()
+                    ]
+            except FileNotFoundError:
+                self._assets = []
+        return self._assets
+
+    def invalidate_assets(self) -> None:
+        """Forget the cached asset list so the next lookup rescans."""
+        self._assets = None
 
     def _select_random_asset(self, output_path: Path) -> Path:
-        """Select a random pre-generated thumbnail and copy to output."""
+        """Select a random pre-generated thumbnail and copy to output.
+
+        Avoids the most recent picks so consecutive mixes get different
+        thumbnails; at least one asset is always left to choose from.
+        """
         assets = self._get_asset_images()
         if not assets:
             raise ThumbnailError("No pre-generated thumbnails found in assets directory")
 
-        selected = random.choice(assets)
+        window = min(len(assets) - 1, RECENT_ASSETS)
+        recent = set(itertools.islice(reversed(self._recent), window))
+        selected = random.choice([asset for asset in assets if asset not in recent])
+        self._recent.append(selected)
+
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(selected, output_path)
+        shutil.copyfile(selected, output_path)
         logger.info(f"Selected pre-generated thumbnail: {selected.name} -> {output_path}")
         return output_path
 
@@ -62,7 +98,12 @@ class ThumbnailGenerator:
         logger.info(f"Generated prompt: {prompt[:100]}...")
         return prompt
 
-    async def generate(self, output_path: Path) -> Path:
+    @property
+    def uses_assets(self) -> bool:
+        """Whether generate() will pick a pre-generated thumbnail."""
+        return bool(self._get_asset_images())
+
+    async def generate(self, output_path: Path, prompt: Optional[str] = None) -> Path:
         """Generate a thumbnail from pre-generated assets or dynamically.
 
         If pre-generated thumbnails exist in assets_directory, randomly
@@ -70,6 +111,7 @@ class ThumbnailGenerator:
 
         Args:
             output_path: Path to save image
+            prompt: Image prompt to use; generated with Gemini if omitted
 
         Returns:
             Path to generated image
@@ -89,11 +131,13 @@ class ThumbnailGenerator:
             from google.genai import types
 
             # Step 1: Generate unique prompt
-            image_prompt = self._generate_prompt()
+            # Gemini calls block, so run them in a thread to keep the event loop free
+            image_prompt = prompt or await asyncio.to_thread(self._generate_prompt)
 
             # Step 2: Generate image from prompt
             logger.info("Generating image...")
-            response = self.client.models.generate_content(
+            response = await asyncio.to_thread(
+                self.client.models.generate_content,
                 model=self.config.model,
                 contents=image_prompt,
                 config=types.GenerateContentConfig(
@@ -101,17 +145,25 @@ class ThumbnailGenerator:
                 ),
             )
 
+            image = next(
+                (
+                    part.inline_data.data
+                    for part in response.candidates[0].content.parts
+                    if part.inline_data is not None
+                ),
+                None,
+            )
+            # Drop the rest of the response before writing so only the image
+            # bytes stay alive
+            del response
+            if image is None:
+                raise ThumbnailError("No image data in response")
+
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            for part in response.candidates[0].content.parts:
-                if part.inline_data is not None:
-                    with open(output_path, "wb") as f:
-                        f.write(part.inline_data.data)
-                    logger.info(f"Thumbnail saved: {output_path}")
-                    return output_path
-
-            raise ThumbnailError("No image data in response")
+            await asyncio.to_thread(output_path.write_bytes, image)
+            logger.info(f"Thumbnail saved: {output_path}")
+            return output_path
 
         except Exception as e:
             if isinstance(e, ThumbnailError):
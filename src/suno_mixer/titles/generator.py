@@ -3,7 +3,12 @@
 import logging
 
 from suno_mixer.config import ThumbnailConfig
-from suno_mixer.presets import TITLE_SYSTEM_PROMPT
+from suno_mixer.models import MixCopy
+from suno_mixer.presets import (
+    MIX_COPY_THUMBNAIL_INSTRUCTIONS,
+    render_mix_copy_prompt,
+    render_title_prompt,
+)
 from suno_mixer.presets import generate_titles as generate_titles_fallback
 
 logger = logging.getLogger(__name__)
@@ -54,7 +59,7 @@ class TitleGenerator:
             return self._fallback_generate(count)
 
         try:
-            prompt = TITLE_SYSTEM_PROMPT.format(
+            prompt = render_title_prompt(
                 genre_name=genre_name,
                 style=style,
                 count=count
@@ -87,6 +92,83 @@ class TitleGenerator:
             logger.error(f"AI title generation failed: {e}, using fallback")
             return self._fallback_generate(count)
 
+    def generate_copy(
+        self,
+        genre_name: str,
+        style: str,
+        mood: str,
+        count: int,
+        duration_hours: int,
+        thumbnail_prompt: bool = True,
+    ) -> MixCopy:
+        """Generate track titles, YouTube title and thumbnail prompt in one call.
+
+        Falls back to generate() for the track titles if the combined call
+        fails, leaving youtube_title and thumbnail_prompt empty so callers
+        use their own generators.
+
+        Args:
+            genre_name: Human-readable genre name (e.g., "Dark Lo-Fi")
+            style: Style tags
+            mood: Mood word (e.g., "FOCUS")
+            count: Number of track titles to generate
+            duration_hours: Expected mix duration in hours
+            thumbnail_prompt: Whether to request a thumbnail image prompt
+
+        Returns:
+            Generated mix text
+        """
+        if not self.config.api_key:
+            logger.warning("No Gemini API key configured, using fallback title generation")
+            return MixCopy(track_titles=self._fallback_generate(count))
+
+        try:
+            from google.genai import types
+
+            prompt = render_mix_copy_prompt(
+                genre_name=genre_name,
+                style=style,
+                mood=mood,
+                duration_hours=duration_hours,
+                count=count,
+                thumbnail_instructions=(
+                    MIX_COPY_THUMBNAIL_INSTRUCTIONS if thumbnail_prompt else "an empty string"
+                ),
+            )
+
+            logger.info(f"Generating {count} AI titles and mix copy for genre: {genre_name}")
+
+            response = self.client.models.generate_content(
+                model="gemini-2.0-flash",
+                contents=prompt,
+                config=types.GenerateContentConfig(
+                    response_mime_type="application/json",
+                    response_schema=MixCopy,
+                ),
+            )
+
+            copy = MixCopy.model_validate_json(response.text)
+            titles = [title.strip() for title in copy.track_titles if title.strip()]
+
+            # Ensure we have enough titles
+            if len(titles) < count:
+                logger.warning(f"AI generated {len(titles)} titles, needed {count}. Padding with fallback.")
+                titles.extend(self._fallback_generate(count - len(titles)))
+
+            youtube_title = copy.youtube_title.strip().strip('"\'')
+            if len(youtube_title) > 100:
+                youtube_title = ""
+
+            return MixCopy(
+                track_titles=titles[:count],
+                youtube_title=youtube_title,
+                thumbnail_prompt=copy.thumbnail_prompt.strip() if thumbnail_prompt else "",
+            )
+
+        except Exception as e:
+            logger.error(f"Combined mix copy generation failed: {e}, generating titles only")
+            return MixCopy(track_titles=self.generate(genre_name, style, count))
+
     def _fallback_generate(self, count: int) -> list[str]:
         """Fallback to word-based title generation.
 
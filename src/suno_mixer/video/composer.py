@@ -1,5 +1,7 @@
 """Video composition with FFmpeg."""
 
+import functools
+import itertools
 import logging
 import shutil
 import subprocess
@@ -12,6 +14,17 @@ from suno_mixer.config import OverlayConfig, VideoConfig, VisualizerConfig
 
 logger = logging.getLogger(__name__)
 
+# JPEG quality for overlay images; YouTube re-encodes thumbnails anyway
+JPEG_QUALITY = 92
+
+# zlib level for PNG overlay images; level 1 encodes much faster than the
+# default 6 for a slightly larger file
+PNG_COMPRESS_LEVEL = 1
+
+# Hardware H.264 encoders tried in order (macOS, NVIDIA, Intel) when the
+# configured codec is libx264
+HARDWARE_ENCODERS = ("h264_videotoolbox", "h264_nvenc", "h264_qsv")
+
 
 class ComposerError(Exception):
     """Video composer error."""
@@ -43,18 +56,18 @@ class VideoComposer:
         if not shutil.which("ffmpeg"):
             raise ComposerError("ffmpeg not found. Please install ffmpeg.")
 
+    @staticmethod
+    def _char_advances(text: str, font: ImageFont.FreeTypeFont) -> list[float]:
+        """Horizontal advance of each character, measuring each distinct one once."""
+        widths = {char: font.getlength(char) for char in set(text)}
+        return [widths[char] for char in text]
+
     def _get_text_width_with_spacing(
         self, text: str, font: ImageFont.FreeTypeFont, letter_spacing: int
     ) -> int:
         """Calculate total text width including letter spacing."""
-        total_width = 0
-        for i, char in enumerate(text):
-            bbox = font.getbbox(char)
-            char_width = bbox[2] - bbox[0]
-            total_width += char_width
-            if i < len(text) - 1:
-                total_width += letter_spacing
-        return total_width
+        advances = self._char_advances(text, font)
+        return int(sum(advances)) + max(0, len(text) - 1) * letter_spacing
 
     def _find_optimal_font_size(
         self,
@@ -82,10 +95,18 @@ class VideoComposer:
         """
         max_width = int(img_width * (1 - 2 * margin_percent))
         max_height = int(img_height * (1 - 2 * margin_percent))
-        font_size = base_font_size
         min_font_size = 40
 
-        while font_size >= min_font_size:
+        # Candidate sizes step down by 10; fitting is monotonic in size, so
+        # binary search for the largest one that fits
+        sizes = range(base_font_size, min_font_size - 1, -10)
+        best = None
+        lo, hi = 0, len(sizes) - 1
+
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            font_size = sizes[mid]
+
             # Scale letter spacing proportionally with font size
             scaled_spacing = int(letter_spacing * (font_size / base_font_size))
 
@@ -97,14 +118,18 @@ class VideoComposer:
             bbox = font.getbbox(text[0]) if text else (0, 0, 0, 0)
             text_height = bbox[3] - bbox[1]
 
-            # Check if text fits
+            # Fits: remember it and try larger sizes, otherwise try smaller
             if text_width <= max_width and text_height <= max_height:
-                if font_size < base_font_size:
-                    logger.info(f"Reduced font size from {base_font_size} to {font_size} to fit text")
-                return font, scaled_spacing
+                best = (font, scaled_spacing, font_size)
+                hi = mid - 1
+            else:
+                lo = mid + 1
 
-            # Reduce font size and try again
-            font_size -= 10
+        if best:
+            font, scaled_spacing, font_size = best
+            if font_size < base_font_size:
+                logger.info(f"Reduced font size from {base_font_size} to {font_size} to fit text")
+            return font, scaled_spacing
 
         # Return minimum size if nothing fits
         logger.warning(f"Text may overflow, using minimum font size {min_font_size}")
@@ -112,11 +137,14 @@ class VideoComposer:
         scaled_spacing = int(letter_spacing * (min_font_size / base_font_size))
         return font, scaled_spacing
 
-    def _load_font(
-        self, font_path: Optional[Path], font_size: int
-    ) -> ImageFont.FreeTypeFont:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_font(font_path: Optional[Path], font_size: int) -> ImageFont.FreeTypeFont:
         """Load font at specified size.
 
+        Cached, since the size search and repeated overlays reload the same
+        path and size.
+
         Args:
             font_path: Optional path to font file
             font_size: Font size in pixels
@@ -147,15 +175,41 @@ class VideoComposer:
         y: int,
         font: ImageFont.FreeTypeFont,
         fill: str,
-        letter_spacing: int,
+        offsets: list[float],
     ) -> None:
-        """Draw text with custom letter spacing."""
-        current_x = x
-        for char in text:
-            draw.text((current_x, y), char, font=font, fill=fill)
-            bbox = font.getbbox(char)
-            char_width = bbox[2] - bbox[0]
-            current_x += char_width + letter_spacing
+        """Draw text with custom letter spacing.
+
+        Args:
+            draw: Draw context
+            text: Text to draw
+            x: Left edge of the text
+            y: Top edge of the text
+            font: Font to draw with
+            fill: Text colour
+            offsets: Per-character x offsets from _char_offsets
+        """
+        for char, offset in zip(text, offsets):
+            draw.text((x + offset, y), char, font=font, fill=fill)
+
+    def _char_offsets(
+        self, text: str, font: ImageFont.FreeTypeFont, letter_spacing: int
+    ) -> tuple[list[float], int]:
+        """Lay out letter-spaced text once for all of its draw passes.
+
+        Args:
+            text: Text to lay out
+            font: Font to measure with
+            letter_spacing: Letter spacing in pixels
+
+        Returns:
+            Tuple of (x offset of each character, total text width)
+        """
+        advances = self._char_advances(text, font)
+        offsets = list(
+            itertools.accumulate((a + letter_spacing for a in advances[:-1]), initial=0.0)
+        )
+        width = int(sum(advances)) + max(0, len(text) - 1) * letter_spacing
+        return offsets, width
 
     def add_text_overlay(
         self,
@@ -177,8 +231,9 @@ class VideoComposer:
         """
         logger.info(f"Adding text overlay: '{text}'")
 
-        # Open image
-        img = Image.open(image_path).convert("RGBA")
+        # Open image; layers are blended in with their alpha as the mask, so
+        # the base stays RGB and needs no conversion back before saving
+        img = Image.open(image_path).convert("RGB")
 
         # Find optimal font size that fits within margins
         font, letter_spacing = self._find_optimal_font_size(
@@ -190,8 +245,8 @@ class VideoComposer:
             letter_spacing=self.overlay_config.letter_spacing,
         )
 
-        # Calculate text dimensions with letter spacing
-        text_width = self._get_text_width_with_spacing(text, font, letter_spacing)
+        # Lay out characters once; glow, shadow and main text share it
+        offsets, text_width = self._char_offsets(text, font, letter_spacing)
         bbox = font.getbbox(text[0]) if text else (0, 0, 0, 0)
         text_height = bbox[3] - bbox[1]
 
@@ -208,24 +263,33 @@ class VideoComposer:
             # Draw text for glow (slightly larger area)
             glow_color = self.overlay_config.glow_color
             self._draw_text_with_spacing(
-                glow_draw, text, x, y, font, glow_color, letter_spacing
+                glow_draw, text, x, y, font, glow_color, offsets
             )
 
-            # Apply blur for glow effect
-            glow_layer = glow_layer.filter(
-                ImageFilter.GaussianBlur(radius=self.overlay_config.glow_radius)
-            )
+            # Apply blur for glow effect. The layer is transparent outside the
+            # text, so only the text's box plus the blur's reach is filtered
+            # and composited.
+            radius = self.overlay_config.glow_radius
+            ink = glow_layer.getbbox()
+            if ink:
+                pad = 3 * radius + 1
+                box = (
+                    max(0, ink[0] - pad),
+                    max(0, ink[1] - pad),
+                    min(img.width, ink[2] + pad),
+                    min(img.height, ink[3] + pad),
+                )
+                glow = glow_layer.crop(box).filter(ImageFilter.GaussianBlur(radius=radius))
 
-            # Adjust glow opacity
-            glow_data = glow_layer.split()
-            if len(glow_data) == 4:
-                alpha = glow_data[3].point(
-                    lambda p: min(p * 2, self.overlay_config.glow_opacity)
+                # Adjust glow opacity
+                glow.putalpha(
+                    glow.getchannel("A").point(
+                        lambda p: min(p * 2, self.overlay_config.glow_opacity)
+                    )
                 )
-                glow_layer.putalpha(alpha)
 
-            # Composite glow onto image
-            img = Image.alpha_composite(img, glow_layer)
+                # Composite glow onto image
+                img.paste(glow, box[:2], glow)
 
         # Create text layer
         text_layer = Image.new("RGBA", img.size, (0, 0, 0, 0))
@@ -242,24 +306,27 @@ class VideoComposer:
                 y + shadow_offset,
                 font,
                 shadow_color,
-                letter_spacing,
+                offsets,
             )
 
         # Draw main text
         self._draw_text_with_spacing(
-            text_draw, text, x, y, font, self.overlay_config.font_color, letter_spacing
+            text_draw, text, x, y, font, self.overlay_config.font_color, offsets
         )
 
-        # Composite text onto image
-        img = Image.alpha_composite(img, text_layer)
-
-        # Convert back to RGB for saving
-        img = img.convert("RGB")
+        # Composite text onto image, in place and only where it was drawn
+        ink = text_layer.getbbox()
+        if ink:
+            text_ink = text_layer.crop(ink)
+            img.paste(text_ink, ink[:2], text_ink)
 
-        # Save
+        # Save; format follows the extension, JPEG encodes far faster than PNG
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        img.save(output_path, "PNG")
+        if output_path.suffix.lower() in (".jpg", ".jpeg"):
+            img.save(output_path, "JPEG", quality=JPEG_QUALITY)
+        else:
+            img.save(output_path, "PNG", compress_level=PNG_COMPRESS_LEVEL)
 
         logger.debug(f"Saved overlay image: {output_path}")
         return output_path
@@ -354,7 +421,7 @@ class VideoComposer:
         # [0:a] = audio input, [1:v] = image input
         # Scale image, generate visualizer, overlay visualizer on image
         filter_complex = (
-            f"[1:v]scale={video_width}:{video_height},fade=t=in:st=0:d=2[bg];"
+            f"[1:v]{self._background_filter(video_width, video_height)}[bg];"
             f"[0:a]{viz_filter},format=rgba,"
             f"colorchannelmixer=aa={viz.opacity}[wave];"
             f"[bg][wave]overlay={x_pos}:{y_pos}:format=auto[out]"
@@ -362,6 +429,104 @@ class VideoComposer:
 
         return filter_complex
 
+    def _background_filter(self, video_width: int, video_height: int) -> str:
+        """Build the filter chain that turns the still image into video.
+
+        The image is decoded and scaled once, then the loop filter repeats
+        that frame. Looping at the input (-loop 1) re-decodes the image for
+        every frame, which costs more than the encode itself. The loop never
+        ends, so compose bounds the output with -t.
+
+        Args:
+            video_width: Width of the video in pixels
+            video_height: Height of the video in pixels
+
+        Returns:
+            FFmpeg filter chain for the image input
+        """
+        fps = self.video_config.fps
+        return (
+            f"scale={video_width}:{video_height},"
+            f"loop=loop=-1:size=1,setpts=N/{fps}/TB,"
+            f"fade=t=in:st=0:d=2"
+        )
+
+    @staticmethod
+    def _get_duration(path: Path) -> float:
+        """Read the duration of a media file with ffprobe.
+
+        Args:
+            path: Path to media file
+
+        Returns:
+            Duration in seconds
+
+        Raises:
+            ComposerError: If the duration cannot be read
+        """
+        cmd = [
+            "ffprobe", "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=noprint_wrappers=1:nokey=1",
+            str(path),
+        ]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+            return float(result.stdout.strip())
+        except subprocess.CalledProcessError as e:
+            raise ComposerError(f"Failed to read duration of {path}: {e.stderr}")
+        except ValueError:
+            raise ComposerError(f"Failed to read duration of {path}: {result.stdout!r}")
+
+    @staticmethod
+    @functools.cache
+    def _hardware_encoder() -> Optional[str]:
+        """Find a hardware H.264 encoder that works on this machine.
+
+        ffmpeg lists encoders it was built with even when the hardware is
+        missing, so each candidate encodes a tiny test clip. The result is
+        cached for the process.
+
+        Returns:
+            Encoder name, or None if none of them works
+        """
+        for encoder in HARDWARE_ENCODERS:
+            cmd = [
+                "ffmpeg", "-v", "error",
+                "-f", "lavfi", "-i", "color=black:s=256x256:d=0.1",
+                "-c:v", encoder, "-f", "null", "-",
+            ]
+            try:
+                subprocess.run(cmd, capture_output=True, check=True, timeout=10)
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
+                continue
+            logger.info(f"Using hardware encoder: {encoder}")
+            return encoder
+        return None
+
+    @property
+    def video_args(self) -> list[str]:
+        """ffmpeg output args for the video stream."""
+        config = self.video_config
+        if config.hardware_encoder and config.codec == "libx264":
+            encoder = self._hardware_encoder()
+            if encoder:
+                return ["-c:v", encoder, "-b:v", config.hardware_bitrate]
+        return [
+            "-c:v", config.codec,
+            "-preset", config.preset,
+            "-crf", str(config.crf),
+        ]
+
+    @property
+    def audio_args(self) -> list[str]:
+        """ffmpeg output args for the video's audio track."""
+        return [
+            "-c:a", self.video_config.audio_codec,
+            "-b:a", self.video_config.audio_bitrate,
+        ]
+
     def compose(
         self,
         thumbnail_path: Path,
@@ -369,6 +534,7 @@ class VideoComposer:
         overlay_text: str,
         output_path: Path,
         font_path: Optional[Path] = None,
+        copy_audio: bool = False,
     ) -> tuple[Path, Path]:
         """Compose final video from thumbnail and audio.
 
@@ -382,6 +548,8 @@ class VideoComposer:
             overlay_text: Text to overlay on thumbnail
             output_path: Path for output video
             font_path: Optional path to font file
+            copy_audio: Stream-copy audio already encoded with audio_args
+                instead of re-encoding it
 
         Returns:
             Tuple of (video_path, thumbnail_with_text_path)
@@ -393,9 +561,7 @@ class VideoComposer:
         audio_path = Path(audio_path)
         output_path = Path(output_path)
 
-        # Create YouTube thumbnail with text overlay (separate file)
-        thumbnail_with_text_path = output_path.parent / f"{output_path.stem}_yt_thumb.png"
-        self.add_text_overlay(thumbnail_path, overlay_text, thumbnail_with_text_path, font_path)
+        thumbnail_with_text_path = output_path.parent / f"{output_path.stem}_yt_thumb.jpg"
 
         logger.info(f"Composing video: {output_path}")
 
@@ -407,8 +573,8 @@ class VideoComposer:
         cmd = [
             "ffmpeg",
             "-y",  # Overwrite output
+            "-hide_banner", "-v", "error",  # Only errors reach stderr
             "-i", str(audio_path),  # Input 0: audio
-            "-loop", "1",  # Loop image
             "-i", str(thumbnail_path),  # Input 1: original image (NO text)
         ]
 
@@ -420,33 +586,39 @@ class VideoComposer:
             cmd.extend(["-filter_complex", filter_complex, "-map", "[out]", "-map", "0:a"])
         else:
             # Simple fade-in without visualizer
-            cmd.extend(["-vf", f"scale={width}:{height},fade=t=in:st=0:d=2"])
+            cmd.extend(["-vf", self._background_filter(width, height)])
 
         cmd.extend([
-            "-c:v", self.video_config.codec,
-            "-preset", self.video_config.preset,
-            "-crf", str(self.video_config.crf),
-            "-c:a", self.video_config.audio_codec,
-            "-b:a", self.video_config.audio_bitrate,
+            *self.video_args,
+            *(["-c:a", "copy"] if copy_audio else self.audio_args),
             "-pix_fmt", "yuv420p",  # Compatibility
-            "-shortest",  # End when audio ends
+            "-t", str(self._get_duration(audio_path)),  # End when audio ends
             "-r", str(self.video_config.fps),
             str(output_path),
         ])
 
         logger.debug(f"FFmpeg command: {' '.join(cmd)}")
 
+        # The video uses the clean image, so the YouTube thumbnail (with text
+        # overlay) is rendered while ffmpeg encodes. Nothing reads the pipes
+        # until then, so ffmpeg only writes errors and never fills the pipe
+        process = subprocess.Popen(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
         try:
-            subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
+            self.add_text_overlay(
+                thumbnail_path, overlay_text, thumbnail_with_text_path, font_path
             )
-            logger.info(f"Video created: {output_path}")
-            logger.info(f"YouTube thumbnail created: {thumbnail_with_text_path}")
-            return output_path, thumbnail_with_text_path
-
-        except subprocess.CalledProcessError as e:
-            logger.error(f"FFmpeg error: {e.stderr}")
-            raise ComposerError(f"FFmpeg failed: {e.stderr}")
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+
+        _, stderr = process.communicate()
+        if process.returncode != 0:
+            logger.error(f"FFmpeg error: {stderr}")
+            raise ComposerError(f"FFmpeg failed: {stderr}")
+
+        logger.info(f"Video created: {output_path}")
+        logger.info(f"YouTube thumbnail created: {thumbnail_with_text_path}")
+        return output_path, thumbnail_with_text_path
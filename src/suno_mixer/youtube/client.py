@@ -1,6 +1,7 @@
 """YouTube API client for uploading videos."""
 
 import logging
+import mimetypes
 from pathlib import Path
 from typing import Optional
 
@@ -18,6 +19,10 @@ SCOPES = [
     "https://www.googleapis.com/auth/youtube.force-ssl",
 ]
 
+# Resumable upload chunk size; each chunk is one HTTP request, and the API
+# requires a multiple of 256 KiB
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+
 # Default paths
 DEFAULT_TOKEN_PATH = Path.home() / ".suno-mixer" / "youtube_token.json"
 
@@ -139,7 +144,7 @@ class YouTubeClient:
             str(video_path),
             mimetype="video/mp4",
             resumable=True,
-            chunksize=1024 * 1024,  # 1MB chunks
+            chunksize=UPLOAD_CHUNK_SIZE,
         )
 
         try:
@@ -189,7 +194,8 @@ class YouTubeClient:
         logger.info(f"Setting thumbnail for video {video_id}")
 
         try:
-            media = MediaFileUpload(str(thumbnail_path), mimetype="image/png")
+            mimetype = mimetypes.guess_type(thumbnail_path.name)[0] or "image/png"
+            media = MediaFileUpload(str(thumbnail_path), mimetype=mimetype)
             self.youtube.thumbnails().set(
                 videoId=video_id,
                 media_body=media,
@@ -0,0 +1,68 @@
+"""Tests for audio mixing."""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from pydub import AudioSegment
+
+from suno_mixer.audio.mixer import AudioMixer
+from suno_mixer.config import MixerConfig
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+
+
+def make_tone(path: Path, volume: float, seconds: float = 4) -> Path:
+    """Write a stereo sine tone at the given linear volume."""
+    subprocess.run(
+        [
+            "ffmpeg", "-v", "error", "-y",
+            "-f", "lavfi", "-i", f"sine=frequency=440:duration={seconds}",
+            "-af", f"volume={volume}", "-ac", "2", "-ar", "44100",
+            str(path),
+        ],
+        check=True,
+    )
+    return path
+
+
+def test_crossfade_mix_applies_dbfs_normalization(tmp_path):
+    tracks = [
+        make_tone(tmp_path / f"track{i}.wav", volume)
+        for i, volume in enumerate([0.9, 0.1, 0.02])
+    ]
+    mixer = AudioMixer(
+        MixerConfig(
+            transition_type="crossfade",
+            crossfade_duration_ms=1000,
+            target_loudness_dbfs=-20.0,
+            normalization="dbfs",
+            output_format="wav",
+        )
+    )
+
+    output = mixer.create_mix(tracks, tmp_path / "mix.wav")
+
+    mix = AudioSegment.from_file(output)
+    # Tracks are 4s with 1s overlaps, so each one plays alone in these windows
+    for start_ms, end_ms in [(500, 2500), (4200, 5800), (7500, 9500)]:
+        assert mix[start_ms:end_ms].dBFS == pytest.approx(-20.0, abs=0.5)
+
+
+def test_crossfade_mix_without_normalization_keeps_levels(tmp_path):
+    tracks = [make_tone(tmp_path / f"track{i}.wav", volume) for i, volume in enumerate([0.9, 0.1])]
+    mixer = AudioMixer(
+        MixerConfig(
+            transition_type="crossfade",
+            crossfade_duration_ms=1000,
+            normalization="dbfs",
+            output_format="wav",
+        )
+    )
+
+    output = mixer.create_mix(tracks, tmp_path / "mix.wav", normalize=False)
+
+    mix = AudioSegment.from_file(output)
+    assert mix[500:2500].dBFS == pytest.approx(AudioSegment.from_file(tracks[0]).dBFS, abs=0.5)
+    assert mix[4200:6500].dBFS == pytest.approx(AudioSegment.from_file(tracks[1]).dBFS, abs=0.5)